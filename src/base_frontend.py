@@ -3,8 +3,9 @@
 
 import tkinter as tk
 from tkinter import simpledialog, messagebox, filedialog
-from PIL import Image, ImageTk, ImageOps
+from PIL import Image, ImageTk
 import os
+import shutil
 from backend import Backend, ElementProperties
 from typing import Dict, Tuple, Set, Optional, List
 from functools import lru_cache
@@ -207,10 +208,12 @@ class BaseDentalApp:
                 if img is None:
                     raise ValueError("Image introuvable ou corrompue")
                 img = img.copy().convert("RGBA")
-                if props.flip_x:
-                    img = ImageOps.mirror(img)
-                if props.flip_y:
-                    img = ImageOps.flip(img)
+                if props.flip_x and props.flip_y:
+                    img = img.transpose(Image.Transpose.ROTATE_180)
+                elif props.flip_x:
+                    img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+                elif props.flip_y:
+                    img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
                 w, h = img.size
                 img = img.resize((int(w * props.scale), int(h * props.scale)), Image.Resampling.LANCZOS)
                 img = img.rotate(props.angle, expand=True, resample=Image.BICUBIC)
@@ -434,8 +437,7 @@ class BaseDentalApp:
             try:
                 dest_path = os.path.join(self.image_folder, self.backend.model_manager.current_model['folder'], os.path.basename(file_path))
                 os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                with open(file_path, 'rb') as src, open(dest_path, 'wb') as dst:
-                    dst.write(src.read())
+                shutil.copyfile(file_path, dest_path)
                 self._update_selle_menu(os.path.basename(file_path))
                 self.backend.load_selle_properties(os.path.basename(file_path))
                 messagebox.showinfo("Succès", f"Selle importée : {os.path.basename(file_path)}")
@@ -818,9 +820,7 @@ class BaseDentalApp:
                 offset_y = (self.canvas_manager.height - self.canvas_manager.bg_height) // 2
                 img.paste(bg_resized, (offset_x, offset_y), bg_resized)
 
-            temp_img = Image.new("RGBA", img.size, (0, 0, 0, 0))
-
-            # Dents
+            # Dents et selles directement sur l'image finale
             for filename, obj_id in self.teeth_objects.items():
                 coords = self.canvas_manager.coords(obj_id)
                 if not coords:
@@ -833,7 +833,7 @@ class BaseDentalApp:
                 tooth_img = tooth_img.rotate(rotation, expand=True)
                 pos_x = int(x - tooth_img.width // 2)
                 pos_y = int(y - tooth_img.height // 2)
-                temp_img.alpha_composite(tooth_img, (pos_x, pos_y))
+                img.alpha_composite(tooth_img, (pos_x, pos_y))
 
             # Selles
             for filename in self.selle_canvas_ids:
@@ -842,9 +842,7 @@ class BaseDentalApp:
                 if selle_img:
                     pos_x = int(props.x - selle_img.width // 2)
                     pos_y = int(props.y - selle_img.height // 2)
-                    temp_img.alpha_composite(selle_img, (pos_x, pos_y))
-
-            img.alpha_composite(temp_img)
+                    img.alpha_composite(selle_img, (pos_x, pos_y))
 
             # Nom du fichier
             all_teeth = set(self.backend.model_manager.current_model['teeth'])
@@ -1144,8 +1142,7 @@ class BaseDentalApp:
                 new_path = os.path.join(self.image_folder, self.backend.model_manager.current_model['folder'], new_name)
 
                 # Copier le fichier
-                with open(old_path, 'rb') as src, open(new_path, 'wb') as dst:
-                    dst.write(src.read())
+                shutil.copyfile(old_path, new_path)
 
                 # Créer de nouvelles propriétés pour la copie avec un léger décalage
                 if current_selle in self.backend.model_manager.selles_props:
@@ -1,10 +1,15 @@
 import sqlite3
 import os
+import json
 import random
 
 # Vérifier et modifier la structure de la base de données
 db_path = os.path.join('elements_valides', 'dental_database.db')
 
+# La table Selles stocke les propriétés en JSON (image, props) ; le type y est rangé sous 'type_element'.
+# Les lignes écrites par l'application n'ont pas de type : ce sont des Selles.
+TYPE_SQL = "COALESCE(json_extract(props, '$.type_element'), 'Selles')"
+
 # Chemin vers les images réelles
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 images_root = os.path.join(project_root, "data", "images")
@@ -68,6 +73,12 @@ if os.path.exists(images_root):
     print(f"   Selles: {len(available_files['Selles'])} fichiers")
 
 if os.path.exists(db_path):
+    # Convertir une ancienne table Selles (une colonne par propriété) au format JSON
+    from mvc.model import DatabaseManager
+    manager = DatabaseManager(db_path)
+    manager.initialize_database()
+    manager.close()
+
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
@@ -75,7 +86,7 @@ if os.path.exists(db_path):
     print("\n🧹 Nettoyage de la base de données...")
 
     # Supprimer tous les éléments sauf les Selles existantes
-    cursor.execute("DELETE FROM Selles WHERE type_element != 'Selles'")
+    cursor.execute(f"DELETE FROM Selles WHERE {TYPE_SQL} != 'Selles'")
 
     # Ajouter les vrais fichiers pour chaque type
     for elem_type, files in available_files.items():
@@ -85,9 +96,11 @@ if os.path.exists(db_path):
                 x = 300 + (i * 50)  # Position variable
                 y = 300 + (i * 30)
                 try:
+                    props = {'x': x, 'y': y, 'angle': 0, 'scale': 1.0, 'flip_x': False, 'flip_y': False,
+                             'type_element': elem_type}
                     cursor.execute(
-                        "INSERT INTO Selles (image, x, y, angle, scale, flip_x, flip_y, type_element) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                        (filename, x, y, 0, 1.0, 0, 0, elem_type)
+                        "INSERT INTO Selles (image, props) VALUES (?, ?)",
+                        (filename, json.dumps(props))
                     )
                 except Exception as e:
                     print(f"     Erreur avec {filename}: {e}")
@@ -96,7 +109,7 @@ if os.path.exists(db_path):
 
     # Afficher la nouvelle répartition
     print("\n📊 Nouvelle répartition des éléments:")
-    cursor.execute("SELECT type_element, COUNT(*) FROM Selles GROUP BY type_element")
+    cursor.execute(f"SELECT {TYPE_SQL} AS type_element, COUNT(*) FROM Selles GROUP BY type_element")
     type_counts = cursor.fetchall()
     for type_name, count in type_counts:
         print(f"  {type_name}: {count} éléments")
@@ -104,7 +117,7 @@ if os.path.exists(db_path):
     # Afficher quelques exemples
     print("\n📋 Exemples d'éléments par type:")
     for elem_type in available_files.keys():
-        cursor.execute("SELECT image FROM Selles WHERE type_element = ? LIMIT 3", (elem_type,))
+        cursor.execute(f"SELECT image FROM Selles WHERE {TYPE_SQL} = ? LIMIT 3", (elem_type,))
         examples = cursor.fetchall()
         if examples:
             print(f"  {elem_type}: {[ex[0] for ex in examples]}")
@@ -37,6 +37,8 @@ class AppConfig:
     # Export Settings
     export_quality: int = 95
     export_format: str = "PNG"
+    fast_export: bool = False  # BILINEAR for teeth, configured filter for the background only
+    png_compress_level: int = 1  # zlib level 0-9; raise for smaller, slower-to-write PNGs
 
     # Undo/Redo Settings
     undo_redo_max_size: int = 50
@@ -7,6 +7,7 @@ This module implements the main application using the MVC (Model-View-Controller
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+from functools import partial
 from mvc.model import DentalDesignModel
 from mvc.view import DentalDesignView
 from mvc.controller import DentalDesignController
@@ -38,6 +39,9 @@ class DentalDesignApp:
         # Bind keyboard shortcuts
         self._bind_shortcuts()
 
+        # Pending database writes are flushed before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
     def _initialize_mvc(self):
         """Initialize the MVC components."""
         # Get paths from configuration
@@ -61,7 +65,7 @@ class DentalDesignApp:
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="Actualiser", command=self._refresh)
         file_menu.add_separator()
-        file_menu.add_command(label="Quitter", command=self.root.quit)
+        file_menu.add_command(label="Quitter", command=self._on_close)
         menubar.add_cascade(label="Fichier", menu=file_menu)
 
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -77,6 +81,11 @@ class DentalDesignApp:
         self.root.bind("<Control-y>", lambda e: self.controller.redo())
         self.root.bind("<Control-s>", lambda e: self.controller.save_to_database())
 
+    def _on_close(self):
+        """Save pending edits, then close the window."""
+        self.controller.close()
+        self.root.destroy()
+
     def _refresh(self):
         """Refresh the application."""
         try:
@@ -145,10 +154,12 @@ class DentalAppLauncher:
         # Create header
         self.create_header()
 
-        # Create content
-        self.create_content()
+        # Defer content and footer so the header paints first
+        self.root.after_idle(self._build_deferred)
 
-        # Create footer
+    def _build_deferred(self):
+        """Build the arcade cards and footer once the header is on screen."""
+        self.create_content()
         self.create_footer()
 
     def setup_styles(self):
@@ -165,6 +176,12 @@ class DentalAppLauncher:
                  background=[('active', '#3498db'), ('!disabled', '#ecf0f1')],
                  foreground=[('active', 'white'), ('!disabled', '#7f8c8d')])
 
+        # Configure hover button style shared by every card
+        style.configure('Hover.TButton', font=('Segoe UI', 12, 'bold'), padding=12)
+        style.map('Hover.TButton',
+                 background=[('active', '#2980b9'), ('!disabled', '#2980b9')],
+                 foreground=[('active', 'white'), ('!disabled', 'white')])
+
         # Configure card frame style
         style.configure('Card.TFrame', background='#ffffff', relief='flat', borderwidth=0)
 
@@ -282,26 +299,24 @@ class DentalAppLauncher:
 
     def add_hover_effect(self, card_container, card, button):
         """Add enhanced hover effects to the card and button."""
-        def on_enter(e):
-            card_container.configure(bg="#d5dbdb")
-            button.configure(style='Hover.TButton')
-
-        def on_leave(e):
-            card_container.configure(bg="#ecf0f1")
-            button.configure(style='Action.TButton')
-
-        # Configure hover button style
-        style = ttk.Style()
-        style.configure('Hover.TButton', font=('Segoe UI', 12, 'bold'), padding=12)
-        style.map('Hover.TButton',
-                 background=[('active', '#2980b9'), ('!disabled', '#2980b9')],
-                 foreground=[('active', 'white'), ('!disabled', 'white')])
+        on_enter = partial(self._on_card_enter, card_container, button)
+        on_leave = partial(self._on_card_leave, card_container, button)
 
         card_container.bind("<Enter>", on_enter)
         card_container.bind("<Leave>", on_leave)
         button.bind("<Enter>", on_enter)
         button.bind("<Leave>", on_leave)
 
+    def _on_card_enter(self, card_container, button, event):
+        """Highlight a card and its button on mouse enter."""
+        card_container.configure(bg="#d5dbdb")
+        button.configure(style='Hover.TButton')
+
+    def _on_card_leave(self, card_container, button, event):
+        """Restore a card and its button on mouse leave."""
+        card_container.configure(bg="#ecf0f1")
+        button.configure(style='Action.TButton')
+
     def create_footer(self):
         """Create the footer with information and links."""
         footer_frame = tk.Frame(self.main_frame, bg="#f8f9fa")
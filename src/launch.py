@@ -10,8 +10,11 @@ import os
 import tkinter as tk
 from tkinter import messagebox
 
+# Répertoire de ce script, calculé une seule fois
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
 # Ajouter le répertoire src au PYTHONPATH
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+src_dir = os.path.join(_HERE, 'src')
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
@@ -65,8 +68,7 @@ def check_database():
 
 def check_image_folders():
     """Vérifier que les dossiers d'images existent."""
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    image_dir = os.path.join(base_dir, 'data', 'images')
+    image_dir = os.path.join(_HERE, 'data', 'images')
     
     required_folders = [
         'dents',
@@ -125,40 +127,33 @@ def launch_application():
 
 def main():
     """Fonction principale."""
-    print("="*60)
-    print("Application de Conception d'Arcades Dentaires - PFE")
-    print("="*60)
-    print()
-    
-    # Vérifier les dépendances
-    print("Vérification des dépendances...")
-    if not check_dependencies():
-        print("\n❌ Des dépendances essentielles sont manquantes.")
-        print("Veuillez installer les dépendances avant de continuer.")
-        input("\nAppuyez sur Entrée pour quitter...")
-        return 1
-    print("✓ Dépendances vérifiées")
-    
-    # Vérifier/créer la base de données
-    print("\nVérification de la base de données...")
-    if not check_database():
-        print("❌ Impossible de créer ou d'accéder à la base de données.")
-        input("\nAppuyez sur Entrée pour quitter...")
-        return 1
-    print("✓ Base de données prête")
+    print("=" * 60 + "\nApplication de Conception d'Arcades Dentaires - PFE\n" + "=" * 60 + "\n")
+    
+    # (titre, vérification, message de succès, message d'échec)
+    checks = [
+        ("Vérification des dépendances...", check_dependencies,
+         "✓ Dépendances vérifiées",
+         "\n❌ Des dépendances essentielles sont manquantes.\n"
+         "Veuillez installer les dépendances avant de continuer."),
+        ("\nVérification de la base de données...", check_database,
+         "✓ Base de données prête",
+         "❌ Impossible de créer ou d'accéder à la base de données."),
+        ("\nVérification des dossiers d'images...", check_image_folders,
+         "✓ Structure des dossiers vérifiée",
+         "❌ Problème avec les dossiers d'images."),
+    ]
     
-    # Vérifier/créer les dossiers d'images
-    print("\nVérification des dossiers d'images...")
-    if not check_image_folders():
-        print("❌ Problème avec les dossiers d'images.")
-        input("\nAppuyez sur Entrée pour quitter...")
-        return 1
-    print("✓ Structure des dossiers vérifiée")
+    # Le titre de chaque étape est affiché avant sa vérification, qui peut afficher ses propres messages
+    for title, check, success_msg, failure_msg in checks:
+        print(title)
+        if not check():
+            print(failure_msg)
+            input("\nAppuyez sur Entrée pour quitter...")
+            return 1
+        print(success_msg)
     
     # Lancer l'application
-    print("\n" + "="*60)
-    print("Lancement de l'application...")
-    print("="*60 + "\n")
+    print("\n" + "=" * 60 + "\nLancement de l'application...\n" + "=" * 60 + "\n")
     
     if not launch_application():
         return 1
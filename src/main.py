@@ -9,9 +9,13 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
+from functools import partial
+
+# Directory of this file, computed once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
 # Add src to PYTHONPATH
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _HERE)
 
 from base_frontend import BaseDentalApp
 
@@ -46,10 +50,12 @@ class DentalAppLauncher:
         # Create header
         self.create_header()
         
-        # Create content
+        # Defer content and footer so the header paints first
+        self.root.after_idle(self._build_deferred)
+    
+    def _build_deferred(self):
+        """Build the arcade cards and footer once the header is on screen"""
         self.create_content()
-        
-        # Create footer
         self.create_footer()
     
     def setup_styles(self):
@@ -112,6 +118,12 @@ class DentalAppLauncher:
                  background=[('active', colors['primary']), ('!disabled', '#f1f8ff')],
                  foreground=[('active', 'white'), ('!disabled', colors['primary'])])
 
+        # Hover button style shared by every card
+        style.configure('Hover.TButton', font=('Segoe UI', 12, 'bold'), padding=12)
+        style.map('Hover.TButton',
+                 background=[('active', '#2980b9'), ('!disabled', '#2980b9')],
+                 foreground=[('active', 'white'), ('!disabled', 'white')])
+
         # Store colors for use in other methods
         self.colors = colors
     
@@ -188,11 +200,6 @@ class DentalAppLauncher:
         image_frame.pack(pady=(0, 25))
         image_frame.pack_propagate(False)
 
-        # Create gradient effect background
-        gradient_canvas = tk.Canvas(image_frame, width=220, height=140,
-                                   bg=self.colors['primary'], highlightthickness=0)
-        gradient_canvas.pack(fill=tk.BOTH, expand=True)
-
         # Add icon based on arcade type
         icon_emoji = "⬆️" if "Supérieure" in title else "⬇️"
         tk.Label(image_frame, text=f"{icon_emoji}\n{image_alt}",
@@ -232,26 +239,24 @@ class DentalAppLauncher:
     
     def add_hover_effect(self, card_container, card, button):
         """Add enhanced hover effects to the card and button"""
-        def on_enter(e):
-            card_container.configure(bg="#d5dbdb")
-            button.configure(style='Hover.TButton')
-        
-        def on_leave(e):
-            card_container.configure(bg="#ecf0f1")
-            button.configure(style='Action.TButton')
-        
-        # Configure hover button style
-        style = ttk.Style()
-        style.configure('Hover.TButton', font=('Segoe UI', 12, 'bold'), padding=12)
-        style.map('Hover.TButton',
-                 background=[('active', '#2980b9'), ('!disabled', '#2980b9')],
-                 foreground=[('active', 'white'), ('!disabled', 'white')])
+        on_enter = partial(self._on_card_enter, card_container, button)
+        on_leave = partial(self._on_card_leave, card_container, button)
         
         card_container.bind("<Enter>", on_enter)
         card_container.bind("<Leave>", on_leave)
         button.bind("<Enter>", on_enter)
         button.bind("<Leave>", on_leave)
     
+    def _on_card_enter(self, card_container, button, event):
+        """Highlight a card and its button on mouse enter"""
+        card_container.configure(bg="#d5dbdb")
+        button.configure(style='Hover.TButton')
+    
+    def _on_card_leave(self, card_container, button, event):
+        """Restore a card and its button on mouse leave"""
+        card_container.configure(bg="#ecf0f1")
+        button.configure(style='Action.TButton')
+    
     def create_footer(self):
         """Create the footer with information and links"""
         footer_frame = tk.Frame(self.main_frame, bg="#f8f9fa")
@@ -6,13 +6,445 @@ This module contains the controller logic that coordinates between the model and
 """
 
 import os
-from typing import Dict, Tuple, Optional, List, Set
-from PIL import Image, ImageTk, ImageOps
+import math
+import shutil
+import hashlib
+import itertools
+import queue
+import sys
+import threading
+import tkinter as tk
+from tkinter import messagebox
+from typing import Callable, Dict, Iterable, Tuple, Optional, List, Set
+from PIL import Image, ImageTk
 from mvc.model import DentalDesignModel, ToothProperties, SelleProperties
-from mvc.view import DentalDesignView
+from mvc.view import DentalDesignView, save_options
 from config import get_config
 from error_handler import handle_error, ImageProcessingError, DatabaseError, safe_execute
-from collections import deque
+from collections import deque, OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, Future
+import numpy as np
+
+try:
+    import pyvips
+except (ImportError, OSError):  # optional, needs libvips; PIL is used instead
+    pyvips = None
+
+# Resized tooth tiles are kept here between runs, the most recently used ones only
+_THUMB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ppa")
+_THUMB_CACHE_MAX_FILES = 256
+
+# Memory budget of the transformed image cache; a full-size RGBA selle alone can take tens of MB
+_PIPELINE_CACHE_BYTES = 128 * 1024 * 1024
+
+# Cheap filter for on-screen previews; the high quality one is kept for export
+PREVIEW_FILTER = Image.Resampling.BILINEAR
+EXPORT_FILTER = Image.Resampling.LANCZOS
+
+def _thumb_cache_path(src: str, size: Tuple[int, int], resample: int = PREVIEW_FILTER) -> str:
+    """Get the disk cache path of ``src`` resized to ``size``.
+
+    The key is the path, modification time and byte size of the source,
+    which one stat call gives without reading the file.
+    """
+    st = os.stat(src)
+    key = f"{os.path.abspath(src)}|{st.st_mtime_ns}|{st.st_size}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    filter_name = Image.Resampling(resample).name.lower()
+    return os.path.join(_THUMB_CACHE_DIR, f"{digest}_{size[0]}x{size[1]}_{filter_name}.png")
+
+def _prune_thumb_cache():
+    """Delete the least recently used tiles beyond ``_THUMB_CACHE_MAX_FILES``."""
+    try:
+        with os.scandir(_THUMB_CACHE_DIR) as entries:
+            tiles = [(e.stat().st_mtime, e.path) for e in entries if e.name.endswith(".png")]
+    except OSError:
+        return
+
+    tiles.sort()
+    for _, tile in tiles[:max(0, len(tiles) - _THUMB_CACHE_MAX_FILES)]:
+        try:
+            os.remove(tile)
+        except OSError:
+            pass
+
+def _load_resized(path: str, size: Tuple[int, int], resample: int = PREVIEW_FILTER,
+                  persist: bool = True) -> Image.Image:
+    """Load ``path`` resized to ``size``.
+
+    Args:
+        path: Path to the source image
+        size: Target size
+        resample: Resampling filter
+        persist: Go through the on-disk tile cache. Only worth it for assets
+            shown at a fixed size such as teeth; selle sizes follow the slider.
+    """
+    with Image.open(path) as img:
+        # Already at the target size: no resize and nothing worth caching on disk
+        if img.size == tuple(size):
+            img.load()
+            return img if img.mode == "RGBA" else img.convert("RGBA")
+
+    cache_path = _thumb_cache_path(path, size, resample) if persist else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with Image.open(cache_path) as img:
+                img.load()
+            os.utime(cache_path)  # mark as recently used for _prune_thumb_cache
+            return img if img.mode == "RGBA" else img.convert("RGBA")
+        except OSError:
+            pass  # corrupted tile, rebuild it below
+
+    img = _vips_resize(path, size) if pyvips is not None else None
+    if img is None:
+        with Image.open(path) as img:
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
+            cv2 = _cv2()
+            if cv2 is not None:
+                img = _cv2_resize(cv2, img, size, resample)
+            else:
+                img = img.resize(size, resample)
+
+    if cache_path:
+        try:
+            os.makedirs(_THUMB_CACHE_DIR, exist_ok=True)
+            img.save(cache_path, optimize=False)
+            _prune_thumb_cache()
+        except OSError as e:
+            print(f"Impossible d'écrire le cache d'image {cache_path}: {e}")
+    return img
+
+@lru_cache(maxsize=None)
+def _cv2():
+    """Import OpenCV on first use, since it adds a noticeable delay to startup.
+
+    Returns the module, or None when it is not installed, in which case
+    PIL is used instead.
+    """
+    try:
+        import cv2
+    except ImportError:
+        return None
+    return cv2
+
+# Filters supported by Image.transform
+_AFFINE_FILTERS = (Image.NEAREST, Image.BILINEAR, Image.BICUBIC)
+
+# OpenCV interpolation flag names for the PIL filters an affine warp supports
+_CV2_FILTERS = {
+    Image.NEAREST: "INTER_NEAREST",
+    Image.BILINEAR: "INTER_LINEAR",
+    Image.BICUBIC: "INTER_CUBIC",
+}
+
+def _cv2_resize(cv2, img: Image.Image, size: Tuple[int, int], resample: int) -> Image.Image:
+    """Resize an RGBA image with OpenCV, using the interpolation closest to ``resample``."""
+    if resample in _CV2_FILTERS and resample != Image.BICUBIC:
+        # The cheap filters (previews, fast_export) keep their cheap OpenCV counterpart
+        interp = getattr(cv2, _CV2_FILTERS[resample])
+    elif size[0] < img.width:
+        # INTER_AREA averages the source pixels when shrinking, like PIL's filters
+        interp = cv2.INTER_AREA
+    else:
+        interp = cv2.INTER_LANCZOS4 if resample == Image.LANCZOS else cv2.INTER_CUBIC
+    return Image.fromarray(cv2.resize(np.asarray(img), size, interpolation=interp), "RGBA")
+
+def _cv2_warp(cv2, arr: np.ndarray, size: Tuple[int, int], matrix: Tuple[float, ...],
+              resample: int) -> np.ndarray:
+    """Apply an ``Image.transform`` style affine matrix to an RGBA array with OpenCV."""
+    a, b, c, d, e, f = matrix
+    # OpenCV samples at integer pixel centers where PIL uses +0.5, so shift the offsets
+    m = np.array([
+        [a, b, c + (a + b - 1) / 2],
+        [d, e, f + (d + e - 1) / 2],
+    ])
+    return cv2.warpAffine(
+        arr, m, size,
+        flags=getattr(cv2, _CV2_FILTERS[resample]) | cv2.WARP_INVERSE_MAP,
+        borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0, 0)
+    )
+
+def affine_params(w: int, h: int, angle: float, scale: float, flip_x: bool,
+                  flip_y: bool) -> Tuple[Tuple[int, int], Tuple[float, ...]]:
+    """Compose a flip, a scale and a rotation around the center into one affine map.
+
+    Matches flipping, resizing to ``(int(w * scale), int(h * scale))``, then
+    ``rotate(angle, expand=True)``, output size included.
+
+    Returns:
+        Output size, and the output-to-input matrix for ``Image.transform``
+    """
+    sw, sh = max(1, int(w * scale)), max(1, int(h * scale))
+    angle = angle % 360.0
+    rad = -math.radians(angle)
+    cos_a, sin_a = round(math.cos(rad), 15), round(math.sin(rad), 15)
+
+    # Rotation about the center of the resized image, in the float order Image.rotate uses
+    c0 = cos_a * -(sw / 2) + sin_a * -(sh / 2) + sw / 2
+    f0 = -sin_a * -(sw / 2) + cos_a * -(sh / 2) + sh / 2
+
+    if angle in (90.0, 270.0):
+        # Image.rotate transposes quarter turns, which swaps the sides exactly
+        new_w, new_h = sh, sw
+    else:
+        # Bounding box of the rotated corners
+        corners = ((0, 0), (sw, 0), (sw, sh), (0, sh))
+        xs = [cos_a * x + sin_a * y + c0 for x, y in corners]
+        ys = [-sin_a * x + cos_a * y + f0 for x, y in corners]
+        new_w = max(1, math.ceil(max(xs)) - math.floor(min(xs)))
+        new_h = max(1, math.ceil(max(ys)) - math.floor(min(ys)))
+
+    # Output pixel -> un-rotate (centered in the expanded canvas) -> un-scale -> un-flip
+    tx, ty = -(new_w - sw) / 2.0, -(new_h - sh) / 2.0
+    c_rot = cos_a * tx + sin_a * ty + c0
+    f_rot = -sin_a * tx + cos_a * ty + f0
+    sx, sy = sw / w, sh / h
+    fx = -1.0 if flip_x else 1.0
+    fy = -1.0 if flip_y else 1.0
+    a, b = fx * cos_a / sx, fx * sin_a / sx
+    d, e = -fy * sin_a / sy, fy * cos_a / sy
+    c = w / 2 + fx * (c_rot - sw / 2) / sx
+    f = h / 2 + fy * (f_rot - sh / 2) / sy
+    return (new_w, new_h), (a, b, c, d, e, f)
+
+def _affine_transform(img: Image.Image, rotation: float, scale: float, flip_x: bool, flip_y: bool,
+                      resample: int) -> Image.Image:
+    """Flip, scale and rotate an RGBA image in one resampling pass, with OpenCV when installed."""
+    size, matrix = affine_params(img.width, img.height, rotation, scale, flip_x, flip_y)
+    cv2 = _cv2()
+    if cv2 is not None:
+        return Image.fromarray(_cv2_warp(cv2, np.asarray(img), size, matrix, resample), "RGBA")
+    return img.transform(size, Image.AFFINE, matrix, resample=resample)
+
+def _vips_resize(path: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+    """Decode and shrink ``path`` in one step with libvips, or None if it fails.
+
+    libvips always uses its own lanczos3 kernel, whatever filter PIL would use.
+    """
+    try:
+        vimg = pyvips.Image.thumbnail(path, size[0], height=size[1], size="force")
+        if vimg.interpretation != "srgb":
+            vimg = vimg.colourspace("srgb")
+        if not vimg.hasalpha():
+            vimg = vimg.bandjoin(255)
+        return Image.frombytes("RGBA", size, vimg.cast("uchar").write_to_memory())
+    except pyvips.Error as e:
+        print(f"libvips n'a pas pu charger {path}, utilisation de PIL: {e}")
+        return None
+
+class _ImageCache:
+    """Least recently used images, bounded by the memory of their pixels."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._items: OrderedDict = OrderedDict()
+        self._bytes = 0
+        # Filled from the prefetch and export worker threads too
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[Image.Image]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key, img: Image.Image):
+        nbytes = img.width * img.height * len(img.getbands())
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._items[key] = (img, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+_pipeline_cache = _ImageCache(_PIPELINE_CACHE_BYTES)
+
+def _transform_pipeline(path: str, mtime: float, size: Optional[Tuple[int, int]],
+                        scale: float, rotation: float, flip_x: bool, flip_y: bool,
+                        resample: int = PREVIEW_FILTER) -> Image.Image:
+    """Decode, resize, flip and rotate an image.
+
+    Results are kept in ``_pipeline_cache``; ``mtime`` is part of the key so
+    edited files are decoded again. The returned image is shared and must not
+    be modified.
+
+    Args:
+        path: Path to the source image
+        mtime: Modification time of the source image
+        size: Target size, or None to scale the source size by ``scale``
+        scale: Scale factor applied when ``size`` is None
+        rotation: Rotation angle in degrees
+        flip_x: Whether to flip horizontally
+        flip_y: Whether to flip vertically
+        resample: Resampling filter used for the resize
+    """
+    key = (path, mtime, size, scale, rotation, flip_x, flip_y, resample)
+    img = _pipeline_cache.get(key)
+    if img is None:
+        img = _transform_image(path, size, scale, rotation, flip_x, flip_y, resample)
+        _pipeline_cache.put(key, img)
+    return img
+
+def _transform_image(path: str, size: Optional[Tuple[int, int]], scale: float, rotation: float,
+                     flip_x: bool, flip_y: bool, resample: int) -> Image.Image:
+    """Uncached body of ``_transform_pipeline``."""
+    fixed_size = size is not None
+    if size is None:
+        with Image.open(path) as img:
+            w, h = img.size
+        if scale > 1.0 and rotation % 360 and resample in _AFFINE_FILTERS:
+            # Enlarging needs no antialiasing, so the resize is folded into the rotation pass.
+            # Shrinking, and filters Image.transform lacks (LANCZOS), keep the separate resize below.
+            img = _load_resized(path, (w, h), resample, persist=False)
+            return _affine_transform(img, rotation, scale, flip_x, flip_y, resample)
+        size = (w, h) if scale == 1.0 else (int(w * scale), int(h * scale))
+
+    # Flipping commutes with resizing, so the resized tile can be shared
+    img = _load_resized(path, size, resample, persist=fixed_size)
+
+    if rotation % 360 and (flip_x or flip_y or _cv2() is not None):
+        # One resampling pass: the flips are folded into the rotation matrix
+        return _affine_transform(img, rotation, 1.0, flip_x, flip_y, Image.BICUBIC)
+
+    # Both flips together are a half turn, done in a single pass
+    if flip_x and flip_y:
+        img = img.transpose(Image.Transpose.ROTATE_180)
+    elif flip_x:
+        img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    elif flip_y:
+        img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+
+    if rotation % 360:
+        img = img.rotate(rotation, expand=True, resample=Image.BICUBIC)
+    return img
+
+@lru_cache(maxsize=None)
+def _numba_blend():
+    """Compile the parallel "over" kernel on first use.
+
+    Returns ``kernel(canvas, src, x0, y0, sx, sy, h, w)``, blending the
+    ``h`` x ``w`` block of the uint8 RGBA ``src`` starting at (sx, sy) into
+    the premultiplied float32 ``canvas`` at (x0, y0), or None when Numba is
+    not installed. Rows are split across threads, so overlapping items are
+    still blended in order.
+
+    Both arrays are passed whole rather than sliced, so they keep a
+    C-contiguous layout and every export shares the one vectorizable
+    specialization instead of the generic strided one.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True)
+    def kernel(canvas, src, x0, y0, sx, sy, h, w):
+        inv255 = np.float32(1.0 / 255.0)
+        for i in prange(h):
+            crow = canvas[y0 + i]
+            srow = src[sy + i]
+            for j in range(w):
+                a = srow[sx + j, 3] * inv255
+                inv = np.float32(1.0) - a
+                for k in range(3):
+                    crow[x0 + j, k] = crow[x0 + j, k] * inv + srow[sx + j, k] * inv255 * a
+                crow[x0 + j, 3] = crow[x0 + j, 3] * inv + a
+
+    return kernel
+
+def _blend_over(canvas: np.ndarray, img: Image.Image, x: int, y: int):
+    """Porter-Duff "over" of ``img`` onto a premultiplied float32 RGBA canvas.
+
+    ``img`` is placed with its top-left corner at (x, y) and clipped to the
+    canvas bounds. The canvas is modified in place.
+    """
+    h, w = canvas.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + img.width, w), min(y + img.height, h)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    kernel = _numba_blend()
+    if kernel is not None:
+        kernel(canvas, np.asarray(img), x0, y0, x0 - x, y0 - y, y1 - y0, x1 - x0)
+        return
+
+    src = np.asarray(img)[y0 - y:y1 - y, x0 - x:x1 - x]
+    dst = canvas[y0:y1, x0:x1]
+    src = src.astype(np.float32) / 255.0
+    alpha = src[..., 3:4]
+    dst *= 1.0 - alpha
+    dst[..., :3] += src[..., :3] * alpha
+    dst[..., 3:] += alpha
+
+def _alpha_crop(img: Image.Image) -> Optional[Tuple[Image.Image, int, int]]:
+    """Crop an RGBA image to the bounding box of its non-transparent pixels.
+
+    Returns the cropped image with its offset in ``img``, or None if
+    ``img`` is fully transparent.
+    """
+    bbox = img.getchannel("A").getbbox()
+    if bbox is None:
+        return None
+    if bbox == (0, 0, img.width, img.height):
+        return img, 0, 0
+    return img.crop(bbox), bbox[0], bbox[1]
+
+def _canvas_to_image(canvas: np.ndarray) -> Image.Image:
+    """Convert a premultiplied float32 RGBA canvas back to an RGBA image."""
+    alpha = canvas[..., 3:4]
+    rgb = np.divide(canvas[..., :3], alpha, out=np.zeros_like(canvas[..., :3]), where=alpha > 0)
+    out = np.concatenate((rgb, alpha), axis=-1) * 255.0 + 0.5
+    return Image.fromarray(np.clip(out, 0, 255).astype(np.uint8), "RGBA")
+
+# Exported images are encoded and written one at a time, off the Tk thread. Pillow's
+# encoders release the GIL, so a thread is enough and the image is never pickled.
+_save_pool = ThreadPoolExecutor(max_workers=1)
+
+# How often the Tk thread collects finished background work, in milliseconds
+_RESULT_POLL_MS = 15
+
+# cancel_futures only exists from Python 3.9; older versions let queued jobs run
+_SHUTDOWN_CANCEL = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+
+@lru_cache(maxsize=None)
+def _tooth_number(filename: str) -> int:
+    """Get the tooth number from a filename such as 'dent_31.png'."""
+    return int(filename.split('_')[1].split('.')[0])
+
+def _format_tooth_ranges(numbers: Iterable[int]) -> List[str]:
+    """Group tooth numbers into sorted runs such as ['3-5', '7']."""
+    numbers = np.unique(np.fromiter(numbers, dtype=np.int32))
+    if not len(numbers):
+        return []
+    # Indices where a run of consecutive numbers starts, plus the end sentinel
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(numbers) != 1) + 1, [len(numbers)]))
+    ranges = []
+    for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        first, last = numbers[start], numbers[end - 1]
+        ranges.append(str(first) if first == last else f"{first}-{last}")
+    return ranges
+
+def _prefetch_image(path: str, size: Tuple[int, int]):
+    """Warm the pipeline cache from a worker thread; errors are reported later on the Tk thread."""
+    try:
+        _transform_pipeline(path, os.path.getmtime(path), size, 1.0, 0.0, False, False, PREVIEW_FILTER)
+    except Exception:
+        pass
 
 class DentalDesignController:
     """Controller class that coordinates between the model and view."""
@@ -33,6 +465,31 @@ class DentalDesignController:
         # Set up initial state
         self.dent_size = self.config.default_dent_size
         self.teeth_positions: Dict[str, Tuple[float, float, float, float, bool]] = {}
+        self._sync_teeth_arrays()
+        self._resize_after_id = None
+        self._selle_files_cache: Dict[str, Tuple[int, List[str]]] = {}
+        self._selle_folder = ""
+        self._selle_paths: Dict[str, str] = {}
+        self._drag_target: Optional[Tuple[float, float]] = None
+        self._drag_after_id = None
+        self._static_layer_key = None
+        self._static_layer: Optional[np.ndarray] = None
+        # Working canvas of the export, reused while the canvas size stays the same
+        self._export_canvas: Optional[np.ndarray] = None
+
+        # Selle images are transformed off the Tk thread. Each pending display
+        # maps to (request number, select once shown); a result whose request
+        # is no longer the pending one is dropped.
+        self._selle_executor = ThreadPoolExecutor(max_workers=2)
+        self._selle_requests = itertools.count()
+        self._pending_selles: Dict[str, Tuple[int, bool]] = {}
+
+        # Finished background jobs as (callback, future), collected by the Tk
+        # thread: workers must not call into Tk, whose after() blocks until
+        # the main loop serves it
+        self._results: "queue.Queue[Tuple[Callable[[Future], None], Future]]" = queue.Queue()
+        self._running_jobs = 0
+        self._poll_after_id = None
 
         # Register view callbacks
         self._register_view_callbacks()
@@ -56,6 +513,13 @@ class DentalDesignController:
         self.view.register_callback("export_canvas", self._on_export_canvas)
         self.view.register_callback("save_to_database", self._on_save_to_database)
 
+        # Mouse events on every selle item, bound once on the "selle" tag
+        self.view.bind_selle_events(
+            self._start_drag,
+            lambda e, fname: self._do_drag(e),
+            lambda e, fname: self._stop_drag(e)
+        )
+
     def _initialize_application(self):
         """Initialize the application with default settings."""
         # Load the last used model
@@ -67,7 +531,7 @@ class DentalDesignController:
         self.view.model_var.set(last_model)
 
         # Load teeth positions
-        self.teeth_positions = self.model.get_teeth_positions()
+        self._reload_teeth_positions()
 
         # Load background
         self._load_background()
@@ -90,6 +554,26 @@ class DentalDesignController:
         # Set up menu
         self.view.create_menu()
 
+    def _reload_teeth_positions(self):
+        """Reload teeth positions and paths for the current model."""
+        self._selle_folder = self.config.get_selles_folder(self.model.get_current_model_name())
+        self._selle_paths.clear()
+        self.teeth_positions = self.model.get_teeth_positions()
+        self._sync_teeth_arrays()
+
+    def _sync_teeth_arrays(self):
+        """Mirror ``teeth_positions`` as one array per field for vectorized passes."""
+        rows = list(self.teeth_positions.values())
+        self._teeth_names = np.array(list(self.teeth_positions), dtype=object)
+        self._teeth_index = {filename: i for i, filename in enumerate(self.teeth_positions)}
+        teeth_folder = self.config.get_teeth_folder()
+        self._teeth_paths = {filename: os.path.join(teeth_folder, filename) for filename in self.teeth_positions}
+        self._teeth_x = np.array([r[0] for r in rows], dtype=np.float64)
+        self._teeth_y = np.array([r[1] for r in rows], dtype=np.float64)
+        self._teeth_scale = np.array([r[2] for r in rows], dtype=np.float64)
+        self._teeth_rot = np.array([r[3] for r in rows], dtype=np.float64)
+        self._teeth_present = np.array([r[4] for r in rows], dtype=bool)
+
     def _load_last_model(self) -> str:
         """Load the last used model from file."""
         try:
@@ -112,13 +596,11 @@ class DentalDesignController:
         try:
             self._save_last_model()
             self.model.set_current_model(model_name)
-            self.teeth_positions = self.model.get_teeth_positions()
+            self._reload_teeth_positions()
 
             # Clear and reload UI
-            self.view.canvas_manager.delete("all")
-            self.view.teeth_objects.clear()
-            self.view.selle_canvas_ids.clear()
-            self.view.teeth_images.clear()
+            self._pending_selles.clear()
+            self.view.clear_canvas()
 
             # Reload background
             self._load_background()
@@ -138,7 +620,14 @@ class DentalDesignController:
             handle_error(e, "Erreur lors du changement de modèle")
 
     def _on_canvas_resized(self, width: int, height: int):
-        """Handle canvas resize event."""
+        """Handle canvas resize event, debounced so only the final size is rendered."""
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(100, lambda: self._do_resize(width, height))
+
+    def _do_resize(self, width: int, height: int):
+        """Reload the background and selles for the new canvas size."""
+        self._resize_after_id = None
         try:
             self._load_background()
             for filename in self.view.selle_canvas_ids:
@@ -149,15 +638,22 @@ class DentalDesignController:
     def _load_teeth_images(self):
         """Load tooth images."""
         self.view.teeth_images.clear()
-        teeth_folder = self.config.get_teeth_folder()
+        size = (self.dent_size, self.dent_size)
+        paths = self._teeth_paths
 
-        for filename in self.teeth_positions.keys():
-            path = os.path.join(teeth_folder, filename)
+        # Decode and resize in worker threads (Pillow releases the GIL); the
+        # PhotoImages below must still be created on the Tk thread
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(lambda path: _prefetch_image(path, size), paths.values()))
+
+        for filename, path in paths.items():
             try:
-                img = self._load_image_cached(path, (self.dent_size, self.dent_size))
-                if img is None:
-                    img = Image.new('RGBA', (self.dent_size, self.dent_size), (255, 0, 0, 128))
-                self.view.teeth_images[filename] = ImageTk.PhotoImage(img)
+                photo = self._get_photo(path, size)
+                if photo is None:
+                    photo = ImageTk.PhotoImage(
+                        Image.new('RGBA', (self.dent_size, self.dent_size), (255, 0, 0, 128))
+                    )
+                self.view.set_photo(self.view.teeth_images, filename, photo)
             except Exception as e:
                 handle_error(e, f"Erreur lors du chargement de l'image de dent {filename}")
                 self.view.teeth_images[filename] = ImageTk.PhotoImage(
@@ -165,36 +661,85 @@ class DentalDesignController:
                 )
 
     @staticmethod
-    def _load_image_cached(path: str, size: Tuple[int, int]) -> Optional[Image.Image]:
-        """Load an image with caching."""
+    def _load_images_parallel(jobs: List[tuple]) -> List[Optional[Image.Image]]:
+        """Load several transformed images through the pipeline cache in worker threads.
+
+        Each job holds the ``_load_image_cached`` arguments. Pillow releases the
+        GIL while decoding and resampling, so the images are prepared
+        concurrently; failures are reported here on the calling thread.
+
+        Returns:
+            The images in job order, None for those that failed
+        """
+        def load(path, *args):
+            return _transform_pipeline(path, os.path.getmtime(path), *args)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(load, *job) for job in jobs]
+
+        images = []
+        for job, future in zip(jobs, futures):
+            try:
+                images.append(future.result())
+            except Exception as e:
+                handle_error(e, f"Erreur lors du chargement de l'image {job[0]}", show_traceback=False)
+                images.append(None)
+        return images
+
+    @staticmethod
+    def _load_image_cached(path: str, size: Optional[Tuple[int, int]], scale: float = 1.0,
+                           rotation: float = 0.0, flip_x: bool = False,
+                           flip_y: bool = False,
+                           resample: int = PREVIEW_FILTER) -> Optional[Image.Image]:
+        """Load a transformed image through the shared pipeline cache."""
         try:
-            with Image.open(path) as img:
-                return img.resize(size, getattr(Image.Resampling, config.image_resampling_method))
+            return _transform_pipeline(path, os.path.getmtime(path), size, scale, rotation,
+                                       flip_x, flip_y, resample)
         except Exception as e:
             handle_error(e, f"Erreur lors du chargement de l'image {path}", show_traceback=False)
             return None
 
-    def _display_tooth(self, filename: str):
-        """Display a tooth on the canvas."""
+    def _get_photo(self, path: str, size: Optional[Tuple[int, int]], scale: float = 1.0,
+                   rotation: float = 0.0, flip_x: bool = False,
+                   flip_y: bool = False) -> Optional[ImageTk.PhotoImage]:
+        """Get a PhotoImage for a transformed image, reusing the view's cache."""
+        try:
+            key = (path, os.path.getmtime(path), size, scale, rotation, flip_x, flip_y)
+        except OSError as e:
+            handle_error(e, f"Erreur lors du chargement de l'image {path}", show_traceback=False)
+            return None
+
+        photo = self.view.get_cached_photo(key)
+        if photo is None:
+            img = self._load_image_cached(path, size, scale, rotation, flip_x, flip_y)
+            if img is None:
+                return None
+            photo = ImageTk.PhotoImage(img)
+            self.view.cache_photo(key, photo)
+        return photo
+
+    def _display_tooth(self, filename: str, pos: Optional[Tuple[float, float]] = None):
+        """Display a present tooth on the canvas, at ``pos`` if already adjusted to the canvas."""
         if filename in self.view.teeth_objects:
             return
 
-        x, y, scale, rotation, present = self.teeth_positions.get(
-            filename, 
-            (self.view.canvas_manager.width // 2, self.view.canvas_manager.height // 2, 1.0, 0.0, True)
-        )
-
-        if not present:
+        i = self._teeth_index.get(filename)
+        if i is None or not self._teeth_present[i]:
             return
+        x, y = float(self._teeth_x[i]), float(self._teeth_y[i])
+        scale, rotation = float(self._teeth_scale[i]), float(self._teeth_rot[i])
 
-        if hasattr(self.view.canvas_manager, 'bg_scale_factor'):
+        if pos is not None:
+            x, y = pos
+        elif hasattr(self.view.canvas_manager, 'bg_scale_factor'):
             x, y = self._adjust_teeth_positions(x, y)
 
         try:
-            img = Image.open(os.path.join(self.config.get_teeth_folder(), filename)).convert("RGBA")
-            img = img.resize((int(self.dent_size * scale), int(self.dent_size * scale)), Image.Resampling.LANCZOS)
-            img = img.rotate(rotation, expand=True, resample=Image.BICUBIC)
-            self.view.teeth_images[filename] = ImageTk.PhotoImage(img)
+            size = (int(self.dent_size * scale), int(self.dent_size * scale))
+            photo = self._get_photo(self._teeth_paths[filename], size, rotation=rotation)
+            if photo is None:
+                return
+            self.view.set_photo(self.view.teeth_images, filename, photo)
             img_id = self.view.canvas_manager.create_image(
                 x, y, 
                 image=self.view.teeth_images[filename], 
@@ -202,18 +747,21 @@ class DentalDesignController:
                 anchor=tk.CENTER
             )
             self.view.teeth_objects[filename] = img_id
+            self.view.teeth_coords[filename] = (x, y)
         except Exception as e:
             handle_error(e, f"Erreur lors de l'affichage de la dent {filename}")
 
     def _hide_tooth(self, filename: str):
         """Hide a tooth from the canvas."""
         if filename in self.view.teeth_objects:
-            self.view.canvas_manager.delete(self.view.teeth_objects[filename])
+            self.view.canvas_manager.defer("delete", self.view.teeth_objects[filename])
             del self.view.teeth_objects[filename]
+            self.view.teeth_coords.pop(filename, None)
+            self.view.release_photo(self.view.teeth_images.pop(filename, None))
             self.view.selected_teeth.discard(filename)
 
-    def _adjust_teeth_positions(self, x: float, y: float) -> Tuple[float, float]:
-        """Adjust teeth positions based on canvas scaling."""
+    def _adjust_teeth_positions(self, x, y):
+        """Adjust teeth positions based on canvas scaling (scalars or arrays)."""
         scaled_x = x * self.view.canvas_manager.bg_scale_factor
         scaled_y = y * self.view.canvas_manager.bg_scale_factor
         offset_x = (self.view.canvas_manager.width - self.view.canvas_manager.bg_width) // 2
@@ -226,25 +774,36 @@ class DentalDesignController:
             if filename not in self.teeth_positions:
                 return
 
-            present = self.teeth_positions[filename][4]
-            self.model.set_tooth_present(filename, not present)
-            self.teeth_positions = self.model.get_teeth_positions()
+            x, y, scale, rotation, present = self.teeth_positions[filename]
+            present = not present
+            self.model.set_tooth_present(filename, present)
+
+            # Only the presence flag changed, so patch it instead of reloading every tooth
+            self.teeth_positions[filename] = (x, y, scale, rotation, present)
+            self._teeth_present[self._teeth_index[filename]] = present
 
             if filename in self.view.teeth_objects:
                 self._hide_tooth(filename)
             else:
                 self._display_tooth(filename)
 
-            self._load_teeth_images()
-            self.view.create_teeth_buttons(self.teeth_positions)
+            self.view.update_tooth_button_state(filename, present)
         except Exception as e:
             handle_error(e, "Erreur lors du basculement de la visibilité de la dent")
 
     def _on_display_all_teeth(self):
         """Display all teeth."""
-        for filename in self.teeth_positions.keys():
-            if self.teeth_positions[filename][4]:
+        present = self._teeth_present
+        names = self._teeth_names[present]
+        if not hasattr(self.view.canvas_manager, 'bg_scale_factor'):
+            for filename in names:
                 self._display_tooth(filename)
+            return
+
+        # Scale and offset every present tooth in one pass
+        xs, ys = self._adjust_teeth_positions(self._teeth_x[present], self._teeth_y[present])
+        for filename, x, y in zip(names, xs.tolist(), ys.tolist()):
+            self._display_tooth(filename, (x, y))
 
     def _on_hide_all_teeth(self):
         """Hide all teeth."""
@@ -260,24 +819,29 @@ class DentalDesignController:
 
         try:
             with Image.open(bg_path) as img:
-                img_copy = img.copy()
-                self._resize_background(img_copy)
-                resized_img = img_copy.resize(
+                # Compute the target size from the header before draft() shrinks img.size
+                self._resize_background(img)
+                # JPEG backgrounds are decoded at a reduced scale close to the target (no-op for PNG)
+                img.draft("RGB", (self.view.canvas_manager.bg_width, self.view.canvas_manager.bg_height))
+                resized_img = img.resize(
                     (self.view.canvas_manager.bg_width, self.view.canvas_manager.bg_height), 
-                    Image.Resampling.LANCZOS
-                )
-                self.view.canvas_manager.bg_photo = ImageTk.PhotoImage(resized_img)
-
-                if self.view.canvas_manager.bg_id:
-                    self.view.canvas_manager.delete(self.view.canvas_manager.bg_id)
-
-                self.view.canvas_manager.bg_id = self.view.canvas_manager.create_image(
-                    self.view.canvas_manager.width // 2,
-                    self.view.canvas_manager.height // 2,
-                    image=self.view.canvas_manager.bg_photo,
-                    tags=("background",),
-                    anchor=tk.CENTER
+                    PREVIEW_FILTER
                 )
+                canvas_manager = self.view.canvas_manager
+                canvas_manager.bg_photo = ImageTk.PhotoImage(resized_img)
+                cx, cy = canvas_manager.width // 2, canvas_manager.height // 2
+
+                if canvas_manager.bg_id:
+                    # Reuse the existing canvas item
+                    canvas_manager.itemconfig(canvas_manager.bg_id, image=canvas_manager.bg_photo)
+                    canvas_manager.set_coords(canvas_manager.bg_id, cx, cy)
+                else:
+                    canvas_manager.bg_id = canvas_manager.create_image(
+                        cx, cy,
+                        image=canvas_manager.bg_photo,
+                        tags=("background",),
+                        anchor=tk.CENTER
+                    )
                 self.view.canvas_manager.tag_lower(self.view.canvas_manager.bg_id)
 
                 # Update teeth positions
@@ -323,17 +887,31 @@ class DentalDesignController:
 
     def _get_selle_files(self) -> List[str]:
         """Get list of available dental saddle files."""
-        folder = self.config.get_selles_folder(self.model.get_current_model_name())
+        folder = self._selle_folder
 
         try:
-            files = []
-            if os.path.exists(folder):
-                files = [f for f in os.listdir(folder) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-            return files if files else ["(aucune selle)"]
+            if not os.path.exists(folder):
+                return ["(aucune selle)"]
+
+            # Reuse the last listing while the folder is unchanged
+            mtime = os.stat(folder).st_mtime_ns
+            cached = self._selle_files_cache.get(folder)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            with os.scandir(folder) as entries:
+                files = [e.name for e in entries if e.name.lower().endswith(('.png', '.jpg', '.jpeg'))]
+            files = files if files else ["(aucune selle)"]
+            self._selle_files_cache[folder] = (mtime, files)
+            return files
         except Exception as e:
             handle_error(e, f"Erreur lors de la lecture du dossier {folder}")
             return ["(aucune selle)"]
 
+    def _invalidate_selle_files(self):
+        """Forget the cached selle listing of the current model."""
+        self._selle_files_cache.pop(self._selle_folder, None)
+
     def _on_selle_loaded(self, filename: str):
         """Handle selle loading event."""
         try:
@@ -341,82 +919,124 @@ class DentalDesignController:
                 messagebox.showwarning("Avertissement", "Aucune selle sélectionnée.")
                 return
 
-            props = self.model.load_selle_properties(filename)
-            self._refresh_selle(filename)
-            self._select_selle(filename)
+            self._refresh_selle(filename, select=True)
         except Exception as e:
             handle_error(e, f"Impossible de charger la selle: {filename}")
 
-    def _refresh_selle(self, filename: str):
-        """Refresh a selle on the canvas."""
-        try:
-            props = self.model.load_selle_properties(filename)
-            img = self._load_transformed_image(props)
+    def _props(self, filename: str) -> SelleProperties:
+        """Get the properties of a selle.
 
-            if img:
-                self.view.selle_tk_images[filename] = ImageTk.PhotoImage(img)
+        This is the model's own object, loaded from the database once and
+        kept up to date by the model's ``update_*`` methods.
+        """
+        return self.model.get_selle_properties(filename)
 
-                if filename in self.view.selle_canvas_ids:
-                    self.view.canvas_manager.delete(self.view.selle_canvas_ids[filename])
+    def _refresh_selle(self, filename: str, select: bool = False):
+        """Refresh a selle on the canvas.
 
-                self.view.selle_canvas_ids[filename] = self.view.canvas_manager.create_image(
-                    props.x, props.y, 
-                    image=self.view.selle_tk_images[filename], 
-                    tags=("selle", filename), 
-                    anchor=tk.CENTER
-                )
+        An image missing from the photo cache is transformed on a worker
+        thread and shown once ready, so decoding never blocks the Tk thread.
+
+        Args:
+            filename: Name of the selle image file
+            select: Whether to select the selle once it is shown
+        """
+        try:
+            props = self._props(filename)
+            path = self._selle_path(filename)
+
+            if not os.path.exists(path):
+                print(f"Fichier non trouvé: {path}")
+                return
+
+            key = (path, os.path.getmtime(path), None, props.scale, props.angle, props.flip_x, props.flip_y)
+            photo = self.view.get_cached_photo(key)
+            if photo is not None:
+                self._pending_selles.pop(filename, None)
+                self._place_selle(filename, photo, select)
+                return
 
-                self._bind_selle_events(filename)
+            request = next(self._selle_requests)
+            self._pending_selles[filename] = (request, select)
+            # PhotoImage and canvas calls must happen on the Tk thread
+            self._run_in_background(
+                self._selle_executor,
+                lambda fut: self._on_selle_ready(fut, filename, request, key),
+                _transform_pipeline, *key, PREVIEW_FILTER
+            )
         except Exception as e:
             handle_error(e, f"Erreur lors du rafraîchissement de la selle {filename}")
 
-    def _load_transformed_image(self, props: SelleProperties) -> Optional[Image.Image]:
-        """Load and transform a selle image."""
-        path = os.path.join(
-            self.config.get_selles_folder(self.model.get_current_model_name()), 
-            props.image
-        )
+    def _run_in_background(self, executor: ThreadPoolExecutor, callback: Callable[[Future], None],
+                           func: Callable, *args):
+        """Run ``func(*args)`` on ``executor`` and call ``callback(future)`` on the Tk thread once done."""
+        future = executor.submit(func, *args)
+        self._running_jobs += 1
+        future.add_done_callback(lambda fut: self._results.put((callback, fut)))
+        if self._poll_after_id is None:
+            self._poll_after_id = self.root.after(_RESULT_POLL_MS, self._poll_results)
+
+    def _poll_results(self):
+        """Hand finished background jobs to their callbacks, polling again while any are running."""
+        self._poll_after_id = None
+        while True:
+            try:
+                callback, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._running_jobs -= 1
+            callback(future)
+        if self._running_jobs:
+            self._poll_after_id = self.root.after(_RESULT_POLL_MS, self._poll_results)
+
+    def _on_selle_ready(self, future: Future, filename: str, request: int, key: tuple):
+        """Show a selle image transformed by the worker, unless a newer request replaced it."""
+        pending = self._pending_selles.get(filename)
+        if pending is None or pending[0] != request:
+            return  # superseded by a newer request, or the selle was removed
+        del self._pending_selles[filename]
 
         try:
-            if not os.path.exists(path):
-                print(f"Fichier non trouvé: {path}")
-                return None
-
-            with Image.open(path) as img:
-                if img is None:
-                    raise ValueError("Image introuvable ou corrompue")
+            photo = ImageTk.PhotoImage(future.result())
+            self.view.cache_photo(key, photo)
+            self._place_selle(filename, photo, pending[1])
+        except Exception as e:
+            handle_error(e, f"Erreur lors du rafraîchissement de la selle {filename}")
 
-                img = img.copy().convert("RGBA")
+    def _place_selle(self, filename: str, photo: ImageTk.PhotoImage, select: bool):
+        """Put a selle on the canvas at its current position, replacing its previous item."""
+        props = self._props(filename)
+        self.view.set_photo(self.view.selle_tk_images, filename, photo)
 
-                if props.flip_x:
-                    img = ImageOps.mirror(img)
-                if props.flip_y:
-                    img = ImageOps.flip(img)
+        if filename in self.view.selle_canvas_ids:
+            self.view.canvas_manager.defer("delete", self.view.selle_canvas_ids[filename])
 
-                w, h = img.size
-                img = img.resize((int(w * props.scale), int(h * props.scale)), Image.Resampling.LANCZOS)
-                img = img.rotate(props.angle, expand=True, resample=Image.BICUBIC)
+        self.view.selle_canvas_ids[filename] = self.view.canvas_manager.create_image(
+            props.x, props.y, 
+            image=self.view.selle_tk_images[filename], 
+            tags=("selle", filename), 
+            anchor=tk.CENTER
+        )
+        if select:
+            self._select_selle(filename)
 
-                return img
-        except Exception as e:
-            handle_error(e, f"Impossible de charger l'image {props.image}")
-            return None
+    def _selle_path(self, filename: str) -> str:
+        """Get the path of a selle image for the current model."""
+        path = self._selle_paths.get(filename)
+        if path is None:
+            path = self._selle_paths[filename] = os.path.join(self._selle_folder, filename)
+        return path
 
     def _select_selle(self, filename: str):
         """Select a selle on the canvas."""
         if filename in self.view.selle_canvas_ids:
             self.view.active_selle = filename
 
-            # Lower other selles
-            for fname in self.view.selle_canvas_ids:
-                if fname != filename:
-                    self.view.canvas_manager.tag_lower(self.view.selle_canvas_ids[fname])
-
-            # Raise selected selle
-            self.view.canvas_manager.tag_raise(self.view.selle_canvas_ids[filename])
+            # Raise selected selle to top; the others keep their relative order
+            self.view.canvas_manager.defer("tag_raise", self.view.selle_canvas_ids[filename])
 
             # Update transformation controls
-            self._update_sliders(self.model.load_selle_properties(filename))
+            self._update_sliders(self._props(filename))
 
     def _update_sliders(self, props: SelleProperties):
         """Update transformation sliders with selle properties."""
@@ -429,29 +1049,11 @@ class DentalDesignController:
         if hasattr(self.view, 'selle_y_var'):
             self.view.selle_y_var.set(props.y)
 
-    def _bind_selle_events(self, filename: str):
-        """Bind mouse events to a selle."""
-        canvas_id = self.view.selle_canvas_ids[filename]
-        self.view.canvas_manager.tag_bind(
-            canvas_id, 
-            "<Button-1>", 
-            lambda e, fname=filename: self._start_drag(e, fname)
-        )
-        self.view.canvas_manager.tag_bind(
-            canvas_id, 
-            "<B1-Motion>", 
-            self._do_drag
-        )
-        self.view.canvas_manager.tag_bind(
-            canvas_id, 
-            "<ButtonRelease-1>", 
-            self._stop_drag
-        )
-
     def _start_drag(self, event, filename: str):
         """Start dragging a selle."""
         self.view.active_selle = filename
-        props = self.model.load_selle_properties(filename)
+        props = self._props(filename)
+        self.model.begin_transaction()
         self.view.drag_offset = (event.x - props.x, event.y - props.y)
         self._select_selle(filename)
 
@@ -461,17 +1063,32 @@ class DentalDesignController:
             new_x = max(50, min(self.view.canvas_manager.width - 50, event.x - self.view.drag_offset[0]))
             new_y = max(50, min(self.view.canvas_manager.height - 50, event.y - self.view.drag_offset[1]))
 
-            try:
-                self.view.canvas_manager.set_coords(
-                    self.view.selle_canvas_ids[self.view.active_selle], 
-                    new_x, 
-                    new_y
-                )
-            except Exception as e:
-                handle_error(e, "Erreur lors du déplacement")
+            # Motion events can outpace redraws; only the latest position is applied
+            self._drag_target = (new_x, new_y)
+            if self._drag_after_id is None:
+                self._drag_after_id = self.root.after_idle(self._apply_drag)
+
+    def _apply_drag(self):
+        """Move the dragged selle to the latest pointer position (coords only, no re-render)."""
+        self._drag_after_id = None
+        if self._drag_target is None or self.view.active_selle not in self.view.selle_canvas_ids:
+            return
+
+        try:
+            self.view.canvas_manager.set_coords(
+                self.view.selle_canvas_ids[self.view.active_selle], 
+                *self._drag_target
+            )
+        except Exception as e:
+            handle_error(e, "Erreur lors du déplacement")
+        self._drag_target = None
 
     def _stop_drag(self, event):
         """Stop dragging a selle."""
+        if self._drag_after_id is not None:
+            self.root.after_cancel(self._drag_after_id)
+            self._apply_drag()
+
         if self.view.drag_offset and self.view.active_selle:
             try:
                 final_coords = self.view.canvas_manager.coords(self.view.selle_canvas_ids[self.view.active_selle])
@@ -484,6 +1101,7 @@ class DentalDesignController:
             except Exception as e:
                 handle_error(e, "Erreur lors de l'enregistrement de la position")
 
+        self.model.end_transaction()
         self.view.drag_offset = None
 
     def _on_selle_imported(self, file_path: str):
@@ -492,18 +1110,15 @@ class DentalDesignController:
             if not file_path:
                 return
 
-            dest_path = os.path.join(
-                self.config.get_selles_folder(self.model.get_current_model_name()), 
-                os.path.basename(file_path)
-            )
+            dest_path = self._selle_path(os.path.basename(file_path))
 
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
 
-            with open(file_path, 'rb') as src, open(dest_path, 'wb') as dst:
-                dst.write(src.read())
+            shutil.copyfile(file_path, dest_path)
+            self._invalidate_selle_files()
 
             self._update_selle_menu(os.path.basename(file_path))
-            self.model.load_selle_properties(os.path.basename(file_path))
+            self.model.model_manager.selles_props.pop(os.path.basename(file_path), None)
 
             messagebox.showinfo("Succès", f"Selle importée : {os.path.basename(file_path)}")
         except Exception as e:
@@ -519,16 +1134,12 @@ class DentalDesignController:
             if not new_name or new_name == old_name:
                 return
 
-            old_path = os.path.join(
-                self.config.get_selles_folder(self.model.get_current_model_name()), 
-                old_name
-            )
-            new_path = os.path.join(
-                self.config.get_selles_folder(self.model.get_current_model_name()), 
-                new_name
-            )
+            old_path = self._selle_path(old_name)
+            new_path = self._selle_path(new_name)
 
             os.rename(old_path, new_path)
+            self._invalidate_selle_files()
+            self.model.model_manager.selles_props.pop(new_name, None)
             self._update_selle_after_rename(old_name, new_name)
 
             messagebox.showinfo("Succès", f"Selle renommée en {new_name}")
@@ -537,6 +1148,14 @@ class DentalDesignController:
 
     def _update_selle_after_rename(self, old_name: str, new_name: str):
         """Update internal data structures after selle rename."""
+        pending = self._pending_selles.pop(old_name, None)
+        if old_name in self.view.selle_canvas_ids or pending:
+            selles_props = self.model.model_manager.selles_props
+            props = selles_props.pop(old_name, None) or self.model.load_selle_properties(old_name)
+            props.image = new_name
+            selles_props[new_name] = props
+            self.model.save_selle_properties(new_name, props)
+
         if old_name in self.view.selle_canvas_ids:
             self.view.selle_tk_images[new_name] = self.view.selle_tk_images.pop(old_name)
             self.view.selle_canvas_ids[new_name] = self.view.selle_canvas_ids.pop(old_name)
@@ -545,17 +1164,13 @@ class DentalDesignController:
                 tags=("selle", new_name)
             )
 
-            props = self.model.load_selle_properties(old_name)
-            props.image = new_name
-            self.model.save_selle_properties(new_name, props)
-
-            if old_name in self.model.model_manager.selles_props:
-                self.model.model_manager.selles_props[new_name] = self.model.model_manager.selles_props.pop(old_name)
-                self.model.model_manager.selles_props[new_name].image = new_name
-
             if self.view.active_selle == old_name:
                 self.view.active_selle = new_name
 
+        if pending:
+            # The old path no longer exists; transform the image again under its new name
+            self._refresh_selle(new_name, select=pending[1])
+
         self._update_selle_menu(new_name)
 
     def _on_selle_deleted(self, filename: str):
@@ -566,14 +1181,14 @@ class DentalDesignController:
                 return
 
             if messagebox.askyesno("Confirmer", f"Voulez-vous vraiment supprimer {filename} ?"):
-                path = os.path.join(
-                    self.config.get_selles_folder(self.model.get_current_model_name()), 
-                    filename
-                )
+                path = self._selle_path(filename)
 
                 os.remove(path)
+                self._invalidate_selle_files()
+                self.model.model_manager.selles_props.pop(filename, None)
                 self._remove_selle_from_canvas(filename)
-                self._update_selle_menu(self._get_selle_files()[0] if self._get_selle_files() else "")
+                selle_files = self._get_selle_files()
+                self._update_selle_menu(selle_files[0] if selle_files else "")
 
                 messagebox.showinfo("Succès", f"Selle {filename} supprimée.")
         except Exception as e:
@@ -581,10 +1196,12 @@ class DentalDesignController:
 
     def _remove_selle_from_canvas(self, selle: str):
         """Remove a selle from the canvas."""
+        # Drop a display still running on the worker
+        self._pending_selles.pop(selle, None)
         if selle in self.view.selle_canvas_ids:
-            self.view.canvas_manager.delete(self.view.selle_canvas_ids[selle])
+            self.view.canvas_manager.defer("delete", self.view.selle_canvas_ids[selle])
             del self.view.selle_canvas_ids[selle]
-            del self.view.selle_tk_images[selle]
+            self.view.release_photo(self.view.selle_tk_images.pop(selle))
 
             if selle in self.model.model_manager.selles_props:
                 del self.model.model_manager.selles_props[selle]
@@ -597,6 +1214,7 @@ class DentalDesignController:
         for filename in list(self.view.selle_canvas_ids.keys()):
             self._remove_selle_from_canvas(filename)
 
+        self._pending_selles.clear()
         self.model.model_manager.selles_props.clear()
 
     def _on_show_all_selles(self):
@@ -606,132 +1224,202 @@ class DentalDesignController:
 
             for filename in self._get_selle_files():
                 if filename != "(aucune selle)":
-                    props = self.model.load_selle_properties(filename)
-                    if props:
-                        self._refresh_selle(filename)
+                    self._refresh_selle(filename)
         except Exception as e:
             handle_error(e, "Impossible d'afficher toutes les selles")
 
     def _on_export_canvas(self):
         """Export the canvas content to an image file."""
+        # The database should hold the exported design; a failed write is reported but does not block the export
+        self.model.save_all_selle_properties()
+        self._flush_database()
         try:
             print("Début de l'exportation - Vérification des selles:", len(self.view.selle_canvas_ids), "selles chargées")
 
-            img = Image.new("RGBA", (self.view.canvas_manager.width, self.view.canvas_manager.height), (255, 255, 255, 255))
+            export_filter = getattr(Image.Resampling, self.config.image_resampling_method, EXPORT_FILTER)
+            # Background and teeth rarely change between exports, only the selles do.
+            # Selles are blended into a copy held in a buffer of the fixed canvas size, so
+            # repeated exports reuse its memory and the blend kernel's compiled specialization.
+            static_layer = self._get_static_layer(export_filter)
+            canvas = self._export_canvas
+            if canvas is None or canvas.shape != static_layer.shape:
+                canvas = self._export_canvas = np.empty_like(static_layer)
+            np.copyto(canvas, static_layer)
+
+            # Draw selles, prepared in parallel and blended in stacking order
+            props_list = [self._props(filename) for filename in self.view.selle_canvas_ids]
+            selle_imgs = self._load_images_parallel([
+                (self._selle_path(filename), None, props.scale, props.angle,
+                 props.flip_x, props.flip_y, export_filter)
+                for filename, props in zip(self.view.selle_canvas_ids, props_list)
+            ])
+            for props, selle_img in zip(props_list, selle_imgs):
+                # Transparent borders would still go through the blend, so only the opaque area is drawn
+                cropped = _alpha_crop(selle_img) if selle_img is not None else None
+                if cropped is None:
+                    continue
+
+                part, dx, dy = cropped
+                pos_x = int(props.x - selle_img.width // 2) + dx
+                pos_y = int(props.y - selle_img.height // 2) + dy
+                _blend_over(canvas, part, pos_x, pos_y)
+
+            img = _canvas_to_image(canvas)
+
+            # Generate filename based on missing teeth
+            missing_str = self._missing_teeth_label()
 
-            bg_path = os.path.join(
-                self.config.get_backgrounds_folder(), 
-                self.model.model_manager.get_current_model().background
+            output_path = os.path.join(
+                self.model.json_dir, 
+                f"design_{self.model.get_current_model_name()}{missing_str}_{self.view.active_selle or 'sans_nom'}.png"
             )
 
-            with Image.open(bg_path) as bg_img:
-                bg_img = bg_img.convert("RGBA")
-                bg_resized = bg_img.resize(
-                    (self.view.canvas_manager.bg_width, self.view.canvas_manager.bg_height), 
-                    Image.Resampling.LANCZOS
-                )
+            # Encode and write in the background; the result is reported on the Tk thread
+            options = save_options(self.config, output_path)
+            self._run_in_background(
+                _save_pool, lambda fut: self._on_export_saved(fut, output_path),
+                lambda: img.save(output_path, **options)
+            )
+        except Exception as e:
+            handle_error(e, "Impossible d'exporter le design")
 
-                offset_x = (self.view.canvas_manager.width - self.view.canvas_manager.bg_width) // 2
-                offset_y = (self.view.canvas_manager.height - self.view.canvas_manager.bg_height) // 2
+    def _on_export_saved(self, future: Future, output_path: str):
+        """Report the outcome of a background export save."""
+        try:
+            future.result()
+        except Exception as e:
+            handle_error(e, "Impossible d'exporter le design")
+            return
 
-                img.paste(bg_resized, (offset_x, offset_y), bg_resized)
+        print(f"Exportation terminée - Selles après exportation:", len(self.view.selle_canvas_ids))
+        messagebox.showinfo("Succès", f"Design exporté vers {output_path}")
 
-            temp_img = Image.new("RGBA", img.size, (0, 0, 0, 0))
+    def _get_static_layer(self, export_filter: int) -> np.ndarray:
+        """Get the background and teeth composited for export, rebuilt only when their layout changes.
 
-            # Draw teeth
-            for filename, obj_id in self.view.teeth_objects.items():
-                coords = self.view.canvas_manager.coords(obj_id)
-                if not coords:
-                    continue
+        The layer is a premultiplied float32 RGBA canvas for ``_blend_over``.
+        It is shared and must be copied before drawing on it.
+        """
+        names = list(self.view.teeth_coords)
+        idx = np.array([self._teeth_index[filename] for filename in names], dtype=np.intp)
+        xy = np.array(list(self.view.teeth_coords.values()), dtype=np.float64).reshape(-1, 2)
+        sizes = (self.dent_size * self._teeth_scale[idx]).astype(int).tolist()
+        teeth = list(zip(names, map(tuple, xy.tolist()), sizes, self._teeth_rot[idx].tolist()))
+
+        # Small teeth look the same with the cheaper filter; the background keeps the configured one
+        tooth_filter = Image.Resampling.BILINEAR if self.config.fast_export else export_filter
+
+        key = (
+            self.model.get_current_model_name(), export_filter, tooth_filter, self.dent_size,
+            self.view.canvas_manager.width, self.view.canvas_manager.height,
+            self.view.canvas_manager.bg_width, self.view.canvas_manager.bg_height,
+            tuple(teeth)
+        )
+        if key == self._static_layer_key:
+            return self._static_layer
 
-                x, y = coords
-                tooth_img = Image.open(os.path.join(self.config.get_teeth_folder(), filename)).convert("RGBA")
+        img = Image.new("RGBA", (self.view.canvas_manager.width, self.view.canvas_manager.height), (255, 255, 255, 255))
 
-                scale, rotation = self.teeth_positions.get(filename, (0, 0, 1.0, 0.0, True))[2:4]
-                tooth_img = tooth_img.resize((int(self.dent_size * scale), int(self.dent_size * scale)), Image.Resampling.LANCZOS)
-                tooth_img = tooth_img.rotate(rotation, expand=True)
+        bg_path = os.path.join(
+            self.config.get_backgrounds_folder(), 
+            self.model.model_manager.get_current_model().background
+        )
 
-                pos_x = int(x - tooth_img.width // 2)
-                pos_y = int(y - tooth_img.height // 2)
-                temp_img.alpha_composite(tooth_img, (pos_x, pos_y))
+        with Image.open(bg_path) as bg_img:
+            bg_img.draft("RGB", (self.view.canvas_manager.bg_width, self.view.canvas_manager.bg_height))
+            bg_img = bg_img.convert("RGBA")
+            bg_resized = bg_img.resize(
+                (self.view.canvas_manager.bg_width, self.view.canvas_manager.bg_height), 
+                export_filter
+            )
 
-            # Draw selles
-            for filename in self.view.selle_canvas_ids:
-                props = self.model.load_selle_properties(filename)
+            offset_x = (self.view.canvas_manager.width - self.view.canvas_manager.bg_width) // 2
+            offset_y = (self.view.canvas_manager.height - self.view.canvas_manager.bg_height) // 2
 
-                if filename in self.view.selle_tk_images:
-                    selle_img = ImageTk.getimage(self.view.selle_tk_images[filename])
-                else:
-                    path = os.path.join(
-                        self.config.get_selles_folder(self.model.get_current_model_name()), 
-                        filename
-                    )
+            img.paste(bg_resized, (offset_x, offset_y), bg_resized)
 
-                    with Image.open(path) as img_selle:
-                        selle_img = img_selle.convert("RGBA").resize(
-                            (int(img_selle.width * props.scale),
-                             int(img_selle.height * props.scale)),
-                            Image.Resampling.LANCZOS
-                        )
-                        selle_img = selle_img.rotate(props.angle, expand=True)
+        # The white base is opaque, so its premultiplied values are the plain ones
+        canvas = np.asarray(img, dtype=np.float32) / 255.0
 
-                pos_x = int(props.x - selle_img.width // 2)
-                pos_y = int(props.y - selle_img.height // 2)
-                temp_img.alpha_composite(selle_img, (pos_x, pos_y))
+        # Draw teeth, re-sampled with the export filter (the on-screen tooth uses the
+        # preview one) in worker threads, then blended in order
+        tooth_imgs = self._load_images_parallel([
+            (self._teeth_paths[filename], (size, size), 1.0, rotation, False, False, tooth_filter)
+            for filename, _, size, rotation in teeth
+        ])
+        # Top-left corners of all the teeth at once; astype truncates like int()
+        half = np.array([(img.width // 2, img.height // 2) if img is not None else (0, 0)
+                         for img in tooth_imgs], dtype=np.float64).reshape(-1, 2)
+        positions = (xy - half).astype(np.int64).tolist()
 
-            img.alpha_composite(temp_img)
+        for (pos_x, pos_y), tooth_img in zip(positions, tooth_imgs):
+            cropped = _alpha_crop(tooth_img) if tooth_img is not None else None
+            if cropped is None:
+                continue
 
-            # Generate filename based on missing teeth
-            all_teeth = set(self.model.model_manager.get_current_model().teeth)
-            present_teeth = {f for f, (_, _, _, _, p) in self.teeth_positions.items() if p}
-            missing_teeth = sorted(int(f.split('_')[1].split('.')[0]) for f in all_teeth - present_teeth)
-
-            missing_str = ""
-            if missing_teeth:
-                ranges = []
-                start = missing_teeth[0]
-                prev = start
-                for current in missing_teeth[1:] + [None]:
-                    if current != prev + 1:
-                        if start == prev:
-                            ranges.append(str(start))
-                        else:
-                            ranges.append(f"{start}-{prev}")
-                        start = current
-                    prev = current
-                missing_str = "_" + "_".join(ranges) if ranges else ""
+            part, dx, dy = cropped
+            _blend_over(canvas, part, pos_x + dx, pos_y + dy)
 
-            output_path = os.path.join(
-                self.model.json_dir, 
-                f"design_{self.model.get_current_model_name()}{missing_str}_{self.view.active_selle or 'sans_nom'}.png"
-            )
+        self._static_layer_key, self._static_layer = key, canvas
+        return canvas
 
-            img.save(output_path)
-            print(f"Exportation terminée - Selles après exportation:", len(self.view.selle_canvas_ids))
-            messagebox.showinfo("Succès", f"Design exporté vers {output_path}")
-        except Exception as e:
-            handle_error(e, "Impossible d'exporter le design")
+    def _missing_teeth_label(self) -> str:
+        """Build the "_3-5_7" style suffix listing missing tooth numbers as ranges."""
+        all_teeth = self.model.model_manager.get_current_model().teeth_set
+        missing = all_teeth - set(self._teeth_names[self._teeth_present])
+        if not missing:
+            return ""
+
+        return "_" + "_".join(_format_tooth_ranges(_tooth_number(f) for f in missing))
 
     def _on_save_to_database(self):
         """Save current configuration to database."""
+        self.model.save_all_selle_properties()
+        if not self._flush_database():
+            return
+
         try:
             if not self.model.model_manager.selles_props:
                 messagebox.showwarning("Avertissement", "Aucune selle à enregistrer.")
                 return
 
-            coords_info = []
-            for filename, props in self.model.model_manager.selles_props.items():
-                coords_info.append(
-                    f"{filename}: (x={props.x:.1f}, y={props.y:.1f}, angle={props.angle:.1f}, scale={props.scale:.2f})"
-                )
+            coords_info = "\n".join(
+                f"{filename}: (x={props.x:.1f}, y={props.y:.1f}, angle={props.angle:.1f}, scale={props.scale:.2f})"
+                for filename, props in self.model.model_manager.selles_props.items()
+            )
 
             messagebox.showinfo(
                 "Coordonnées des Selles",
-                "\n".join(coords_info) + "\n\nUtilisez ces valeurs pour remplir la base de données manuellement."
+                coords_info + "\n\nUtilisez ces valeurs pour remplir la base de données manuellement."
             )
         except Exception as e:
             handle_error(e, "Impossible d'afficher les coordonnées")
 
+    def _flush_database(self) -> bool:
+        """Wait for pending selle writes, reporting a failure to the user.
+
+        Returns:
+            True if everything was written
+        """
+        try:
+            self.model.flush()
+            return True
+        except DatabaseError as e:
+            handle_error(e, "Impossible d'enregistrer les selles dans la base de données", show_traceback=True)
+            return False
+
+    def close(self):
+        """Write pending selle edits before the application window closes."""
+        self._pending_selles.clear()
+        if self._poll_after_id is not None:
+            self.root.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
+        # Selle previews are no longer wanted; a transform already running ends on its own
+        self._selle_executor.shutdown(wait=False, **_SHUTDOWN_CANCEL)
+        # An export still being written must reach the disk before the process exits
+        _save_pool.shutdown()
+        self._flush_database()
+
     def create_undo_redo_system(self):
         """Create an undo/redo system for the application."""
         self.undo_stack = deque(maxlen=self.config.undo_redo_max_size)
@@ -739,7 +1427,10 @@ class DentalDesignController:
 
     def save_state(self):
         """Save current state for undo functionality."""
-        self.undo_stack.append({k: v.to_dict() for k, v in self.model.model_manager.selles_props.items()})
+        snapshot = self.model.snapshot_selles()
+        if self.undo_stack and self.undo_stack[-1] == snapshot:
+            return  # nothing changed since the last frame
+        self.undo_stack.append(snapshot)
         self.redo_stack.clear()
 
     def undo(self):
@@ -747,20 +1438,10 @@ class DentalDesignController:
         if not self.undo_stack:
             return False
 
-        self.redo_stack.append({k: v.to_dict() for k, v in self.model.model_manager.selles_props.items()})
-        state = self.undo_stack.pop()
-
-        self.model.model_manager.selles_props.clear()
-        for filename, props_dict in state.items():
-            self.model.model_manager.selles_props[filename] = SelleProperties.from_dict(props_dict)
-
-        # Refresh UI
-        for filename in self.view.selle_canvas_ids:
-            self._refresh_selle(filename)
-
-        if self.view.active_selle:
-            self._select_selle(self.view.active_selle)
-
+        before = self.model.model_manager.selles_props
+        self.redo_stack.append(self.model.snapshot_selles())
+        self.model.restore_selles(self.undo_stack.pop())
+        self._refresh_changed_selles(before)
         return True
 
     def redo(self):
@@ -768,22 +1449,24 @@ class DentalDesignController:
         if not self.redo_stack:
             return False
 
-        self.undo_stack.append({k: v.to_dict() for k, v in self.model.model_manager.selles_props.items()})
-        state = self.redo_stack.pop()
+        before = self.model.model_manager.selles_props
+        self.undo_stack.append(self.model.snapshot_selles())
+        self.model.restore_selles(self.redo_stack.pop())
+        self._refresh_changed_selles(before)
+        return True
 
-        self.model.model_manager.selles_props.clear()
-        for filename, props_dict in state.items():
-            self.model.model_manager.selles_props[filename] = SelleProperties.from_dict(props_dict)
+    def _refresh_changed_selles(self, before: Dict[str, SelleProperties]):
+        """Refresh only the selles whose properties differ from ``before`` after an undo/redo."""
+        after = self.model.model_manager.selles_props
 
         # Refresh UI
-        for filename in self.view.selle_canvas_ids:
-            self._refresh_selle(filename)
+        for filename in list(self.view.selle_canvas_ids):
+            if before.get(filename) != after.get(filename):
+                self._refresh_selle(filename)
 
         if self.view.active_selle:
             self._select_selle(self.view.active_selle)
 
-        return True
-
     def clear_history(self):
         """Clear undo/redo history."""
         self.undo_stack.clear()
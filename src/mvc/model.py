@@ -6,14 +6,39 @@ This module contains the data models and business logic for the dental design ap
 """
 
 import os
+import sys
+import json
+import time
+import queue
+import atexit
 import sqlite3
-from dataclasses import dataclass, asdict
-from typing import Dict, Tuple, Optional, List
+import threading
+from dataclasses import dataclass, fields
+from typing import Dict, Tuple, Optional, List, Iterable
 from abc import ABC, abstractmethod
-from ..config import get_config
-from ..error_handler import DatabaseError, handle_error
+import numpy as np
+from config import get_config
+from error_handler import DatabaseError, handle_error
 
-@dataclass
+# Statements reused on the shared connection, served from sqlite3's statement cache
+_SELECT_TEETH_SQL = "SELECT fichier, x, y, scale, rotation, present FROM dents"
+_SELECT_TEETH_IN_SQL = _SELECT_TEETH_SQL + " WHERE fichier IN ({})"
+_UPDATE_TOOTH_PRESENT_SQL = "UPDATE dents SET present = ? WHERE fichier = ?"
+_SELECT_SELLE_SQL = "SELECT props FROM Selles WHERE image = ?"
+_SAVE_SELLE_SQL = "INSERT OR REPLACE INTO Selles (image, props) VALUES (?, ?)"
+
+# Selle writes arriving within this delay are committed together by the writer thread
+_WRITE_INTERVAL = 0.016
+
+def _selle_json(x: float, y: float, angle: float, scale: float, flip_x: bool, flip_y: bool) -> str:
+    """Encode the properties of a selle (everything but its image name) as JSON."""
+    return json.dumps({'x': x, 'y': y, 'angle': angle, 'scale': scale,
+                       'flip_x': bool(flip_x), 'flip_y': bool(flip_y)})
+
+# slots=True only exists from Python 3.10; older versions keep a __dict__ per instance
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ToothProperties:
     """Properties of a tooth in the dental arch."""
     filename: str
@@ -23,7 +48,7 @@ class ToothProperties:
     rotation: float = 0.0
     present: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SelleProperties:
     """Properties of a dental saddle."""
     image: str
@@ -34,16 +59,69 @@ class SelleProperties:
     flip_x: bool = False
     flip_y: bool = False
 
+    def __post_init__(self):
+        # Interned so dict lookups keyed by filename can short-circuit on identity
+        self.image = sys.intern(self.image)
+
     def to_dict(self):
         """Convert to dictionary for database storage."""
-        return asdict(self)
+        # Built by hand: asdict() deep-copies every field, all of which are immutable here
+        return {
+            'image': self.image, 'x': self.x, 'y': self.y, 'angle': self.angle,
+            'scale': self.scale, 'flip_x': self.flip_x, 'flip_y': self.flip_y
+        }
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create instance from dictionary."""
         if 'image' not in data:
             raise ValueError("Missing required field 'image' in SelleProperties data")
-        return cls(**data)
+        # Rows may carry extra keys, e.g. the element type written by check_db.py
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+class SelleSnapshot:
+    """Undo frame storing selle properties column-wise.
+
+    Floats (x, y, angle, scale) live in one (N, 4) float64 array and the
+    flips in one (N, 2) bool array, instead of one object per selle.
+    """
+    __slots__ = ('names', 'values', 'flips')
+
+    def __init__(self, names: Tuple[str, ...], values: np.ndarray, flips: np.ndarray):
+        self.names = names
+        self.values = values
+        self.flips = flips
+
+    @classmethod
+    def capture(cls, selles_props: Dict[str, SelleProperties]) -> 'SelleSnapshot':
+        """Build a frame from the current selle properties."""
+        if not selles_props:
+            return _EMPTY_SNAPSHOT
+        props = selles_props.values()
+        return cls(
+            tuple(selles_props),
+            np.array([(p.x, p.y, p.angle, p.scale) for p in props], dtype=np.float64),
+            np.array([(p.flip_x, p.flip_y) for p in props], dtype=bool)
+        )
+
+    def to_props(self) -> Dict[str, SelleProperties]:
+        """Rebuild the selle properties stored in this frame."""
+        return {
+            name: SelleProperties(name, x, y, angle, scale, flip_x, flip_y)
+            for name, (x, y, angle, scale), (flip_x, flip_y)
+            in zip(self.names, self.values.tolist(), self.flips.tolist())
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, SelleSnapshot):
+            return NotImplemented
+        return (self.names == other.names
+                and np.array_equal(self.values, other.values)
+                and np.array_equal(self.flips, other.flips))
+
+# Undo frame of a design without selles, shared instead of rebuilt each time
+_EMPTY_SNAPSHOT = SelleSnapshot((), np.empty((0, 4), dtype=np.float64), np.empty((0, 2), dtype=bool))
 
 class DentalArchModel:
     """Abstract base class for dental arch models."""
@@ -51,10 +129,11 @@ class DentalArchModel:
     def __init__(self, name: str, background: str, teeth: List[str]):
         self.name = name
         self.background = background
-        self.teeth = teeth
+        self.teeth: Tuple[str, ...] = tuple(sys.intern(t) for t in teeth)
+        self.teeth_set = frozenset(self.teeth)
         self.selles_props: Dict[str, SelleProperties] = {}
 
-    def get_tooth_filenames(self) -> List[str]:
+    def get_tooth_filenames(self) -> Tuple[str, ...]:
         """Get list of tooth filenames for this model."""
         return self.teeth
 
@@ -87,6 +166,8 @@ class DentalArchModelManager:
             )
         }
         self.current_model = self.models['arcade_inf']
+        # Properties of the selles used with the current model, keyed by image name
+        self.selles_props: Dict[str, SelleProperties] = {}
 
     def set_current_model(self, model_name: str):
         """Set the current dental arch model."""
@@ -106,12 +187,118 @@ class DatabaseManager:
 
     def __init__(self, db_path: str):
         self.db_path = os.path.abspath(db_path)
+        self.conn = self._connect()
         self._test_connection()
 
+        # Selle writes go through a background thread so the Tk loop never waits on disk;
+        # _pending holds the rows not committed yet so reads still see them. Queue
+        # items only wake the writer up, None stops it.
+        self._write_queue: "queue.Queue[Optional[bool]]" = queue.Queue()
+        self._pending: Dict[str, str] = {}
+        self._pending_lock = threading.Lock()
+        # Error of the last failed batch; its rows stay in _pending and are retried.
+        # Set by the writer thread under _pending_lock, so it always matches _pending.
+        self._write_error: Optional[sqlite3.Error] = None
+        self._writer = threading.Thread(target=self._write_loop, name="selles-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection shared by every database operation."""
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            # Per-connection settings only: the journal mode stored in the shipped file is left alone
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            return conn
+        except sqlite3.Error as e:
+            error_msg = f"Database connection error: {e}"
+            print(error_msg)
+            raise DatabaseError(error_msg)
+
+    def close(self):
+        """Write pending selles, stop the writer thread and close the database connection."""
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+        with self._pending_lock:
+            unwritten, error = len(self._pending), self._write_error
+        if unwritten:
+            print(f"Error saving selle properties: {unwritten} selle(s) not written ({error})")
+        self.conn.close()
+
+    def flush(self):
+        """Block until every queued selle write is committed.
+
+        Rows left over by a failed batch are retried once more first.
+
+        Raises:
+            DatabaseError: If some selles still could not be written; they stay
+                pending and are retried with the next write or flush
+        """
+        if not self._writer.is_alive():
+            return
+        self._write_queue.put(True)
+        self._write_queue.join()
+
+        with self._pending_lock:
+            error = self._write_error if self._pending else None
+        if error is not None:
+            error_msg = f"Error saving selle properties: {error}"
+            print(error_msg)
+            raise DatabaseError(error_msg)
+
+    def _enqueue_selles(self, rows: List[Tuple[str, str]]):
+        """Hand (image, props JSON) rows to the writer thread."""
+        with self._pending_lock:
+            self._pending.update(rows)
+        self._write_queue.put(True)
+
+    def _write_loop(self):
+        """Writer thread: commit pending selle rows in batches on its own connection.
+
+        Each batch writes everything in ``_pending`` (one row per image, the
+        latest one), so the rows of a failed batch go again with the next one.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            items = [self._write_queue.get()]
+            time.sleep(_WRITE_INTERVAL)  # let a burst of edits pile up
+            while True:
+                try:
+                    items.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in items
+
+            with self._pending_lock:
+                batch = dict(self._pending)
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(_SAVE_SELLE_SQL, list(batch.items()))
+                except sqlite3.Error as e:
+                    # Kept in _pending: reads still see the rows and flush() reports the error
+                    print(f"Error saving selle properties: {e}")
+                    with self._pending_lock:
+                        self._write_error = e
+                else:
+                    with self._pending_lock:
+                        self._write_error = None
+                        for image, props in batch.items():
+                            # A newer edit of the same selle may have arrived meanwhile
+                            if self._pending.get(image) is props:
+                                del self._pending[image]
+            for _ in items:
+                self._write_queue.task_done()
+        conn.close()
+
     def _test_connection(self):
         """Test database connection."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
                 print("Successfully connected to database")
@@ -120,15 +307,21 @@ class DatabaseManager:
             print(error_msg)
             raise DatabaseError(error_msg)
 
-    def load_teeth_positions(self) -> Dict[str, Tuple[float, float, float, float, bool]]:
-        """Load teeth positions from the database."""
+    def load_teeth_positions(self, filenames: Optional[Iterable[str]] = None) -> Dict[str, Tuple[float, float, float, float, bool]]:
+        """Load teeth positions from the database, restricted to ``filenames`` if given."""
         positions = {}
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT fichier, x, y, scale, rotation, present FROM dents")
-                for fichier, x, y, scale, rotation, present in cursor.fetchall():
-                    positions[fichier] = (x, y, scale, rotation, bool(present))
+            with self.conn as conn:
+                if filenames is None:
+                    rows = conn.execute(_SELECT_TEETH_SQL).fetchall()
+                else:
+                    filenames = tuple(filenames)
+                    placeholders = ", ".join("?" * len(filenames))
+                    rows = conn.execute(_SELECT_TEETH_IN_SQL.format(placeholders), filenames).fetchall()
+                positions = {
+                    sys.intern(fichier): (x, y, scale, rotation, bool(present))
+                    for fichier, x, y, scale, rotation, present in rows
+                }
         except sqlite3.Error as e:
             error_msg = f"Error loading teeth positions: {e}"
             print(error_msg)
@@ -138,9 +331,8 @@ class DatabaseManager:
     def set_tooth_present(self, filename: str, present: bool):
         """Update the presence status of a tooth in the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE dents SET present = ? WHERE fichier = ?", (int(present), filename))
+            with self.conn as conn:
+                conn.execute(_UPDATE_TOOTH_PRESENT_SQL, (int(present), filename))
                 conn.commit()
         except sqlite3.Error as e:
             error_msg = f"Error setting tooth presence: {e}"
@@ -149,21 +341,20 @@ class DatabaseManager:
 
     def load_selle_properties(self, filename: str) -> Optional[dict]:
         """Load properties of a dental saddle from the database."""
+        with self._pending_lock:
+            pending = self._pending.get(filename)
+        if pending is not None:
+            props = json.loads(pending)
+            props['image'] = filename
+            return props
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT image, x, y, angle, scale, flip_x, flip_y FROM Selles WHERE image = ?",
-                    (filename,)
-                )
-                result = cursor.fetchone()
+            with self.conn as conn:
+                result = conn.execute(_SELECT_SELLE_SQL, (filename,)).fetchone()
                 if result:
-                    image, x, y, angle, scale, flip_x, flip_y = result
-                    return {
-                        'image': image,
-                        'x': x, 'y': y, 'angle': angle, 'scale': scale,
-                        'flip_x': bool(flip_x), 'flip_y': bool(flip_y)
-                    }
+                    props = json.loads(result[0])
+                    props['image'] = filename
+                    return props
         except sqlite3.Error as e:
             error_msg = f"Error loading selle properties: {e}"
             print(error_msg)
@@ -171,24 +362,22 @@ class DatabaseManager:
         return None
 
     def save_selle_properties(self, filename: str, props: dict):
-        """Save properties of a dental saddle to the database."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT OR REPLACE INTO Selles (image, x, y, angle, scale, flip_x, flip_y) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (filename, props['x'], props['y'], props['angle'], props['scale'], int(props['flip_x']), int(props['flip_y']))
-                )
-                conn.commit()
-        except sqlite3.Error as e:
-            error_msg = f"Error saving selle properties: {e}"
-            print(error_msg)
-            raise DatabaseError(error_msg)
+        """Queue the properties of a dental saddle for writing to the database."""
+        self._enqueue_selles([
+            (filename, _selle_json(props['x'], props['y'], props['angle'], props['scale'], props['flip_x'], props['flip_y']))
+        ])
+
+    def save_many_selles(self, items: Iterable[Tuple[str, 'SelleProperties']]):
+        """Queue properties of several dental saddles; the writer commits them in one transaction."""
+        self._enqueue_selles([
+            (filename, _selle_json(p.x, p.y, p.angle, p.scale, p.flip_x, p.flip_y))
+            for filename, p in items
+        ])
 
     def initialize_database(self):
         """Initialize the database with required tables if they don't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.conn as conn:
                 cursor = conn.cursor()
 
                 # Create teeth table
@@ -203,18 +392,14 @@ class DatabaseManager:
                 )
                 """)
 
-                # Create Selles table
+                # Create Selles table: one JSON document of properties per image
                 cursor.execute("""
                 CREATE TABLE IF NOT EXISTS Selles (
                     image TEXT PRIMARY KEY,
-                    x REAL,
-                    y REAL,
-                    angle REAL,
-                    scale REAL,
-                    flip_x INTEGER,
-                    flip_y INTEGER
+                    props TEXT
                 )
                 """)
+                self._migrate_selles_table(cursor)
 
                 conn.commit()
                 print("Database initialized successfully")
@@ -223,6 +408,28 @@ class DatabaseManager:
             print(error_msg)
             raise DatabaseError(error_msg)
 
+    def _migrate_selles_table(self, cursor: sqlite3.Cursor):
+        """Convert a Selles table with one column per property to the JSON layout."""
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(Selles)")]
+        if 'props' in columns:
+            return
+
+        migrated = []
+        for row in cursor.execute("SELECT * FROM Selles").fetchall():
+            props = dict(zip(columns, row))
+            image = props.pop('image')
+            props.pop('id', None)
+            # Extra columns such as type_element are kept inside the JSON
+            props['flip_x'] = bool(props.get('flip_x'))
+            props['flip_y'] = bool(props.get('flip_y'))
+            migrated.append((image, json.dumps(props)))
+
+        cursor.execute("ALTER TABLE Selles RENAME TO Selles_old")
+        cursor.execute("CREATE TABLE Selles (image TEXT PRIMARY KEY, props TEXT)")
+        cursor.executemany(_SAVE_SELLE_SQL, migrated)
+        cursor.execute("DROP TABLE Selles_old")
+        print(f"Migrated Selles table to JSON properties ({len(migrated)} rows)")
+
 class DentalDesignModel:
     """Main model class for the dental design application."""
 
@@ -249,6 +456,9 @@ class DentalDesignModel:
         self.undo_stack = []
         self.redo_stack = []
         self.max_undo_redo = self.config.undo_redo_max_size
+        self._in_txn = False
+        self._txn_changed = False
+        self._dirty: Dict[str, SelleProperties] = {}
 
     def set_current_model(self, model_name: str):
         """Set the current dental arch model."""
@@ -261,9 +471,8 @@ class DentalDesignModel:
 
     def get_teeth_positions(self) -> Dict[str, Tuple[float, float, float, float, bool]]:
         """Get positions of all teeth in the current model."""
-        all_positions = self.db_manager.load_teeth_positions()
         current_model = self.model_manager.get_current_model()
-        return {f: p for f, p in all_positions.items() if f in current_model.get_tooth_filenames()}
+        return self.db_manager.load_teeth_positions(current_model.get_tooth_filenames())
 
     def set_tooth_present(self, filename: str, present: bool):
         """Update the presence status of a tooth."""
@@ -278,49 +487,116 @@ class DentalDesignModel:
         else:
             return SelleProperties(image=filename)
 
+    def get_selle_properties(self, filename: str) -> SelleProperties:
+        """Get the properties of a dental saddle, loading them on first use.
+
+        The returned object is the one the ``update_*`` methods modify.
+        """
+        props = self.model_manager.selles_props.get(filename)
+        if props is None:
+            props = self.model_manager.selles_props[filename] = self.load_selle_properties(filename)
+        return props
+
     def save_selle_properties(self, filename: str, props: SelleProperties):
         """Save properties of a dental saddle."""
-        self.db_manager.save_selle_properties(filename, props.to_dict())
-        self.save_state()
+        if self._in_txn:
+            # Written once when the transaction ends
+            self._dirty[filename] = props
+            self._txn_changed = True
+        else:
+            self.db_manager.save_selle_properties(filename, props.to_dict())
+            self.save_state()
+
+    def begin_transaction(self):
+        """Start a gesture (drag, slider move): edits until end_transaction share one undo snapshot."""
+        self._in_txn = True
+        self._txn_changed = False
+
+    def end_transaction(self):
+        """End the current gesture, write its edits and take its undo snapshot if anything changed."""
+        if not self._in_txn:
+            return
+        self._in_txn = False
+        if self._dirty:
+            dirty, self._dirty = self._dirty, {}
+            self.db_manager.save_many_selles(dirty.items())
+        if self._txn_changed:
+            self._txn_changed = False
+            self.save_state()
+
+    def flush(self):
+        """Wait until every selle edit is written to the database.
+
+        Raises:
+            DatabaseError: If some edits could not be written
+        """
+        self.db_manager.flush()
+
+    def save_all_selle_properties(self):
+        """Save every loaded dental saddle in one transaction."""
+        if self.model_manager.selles_props:
+            self.db_manager.save_many_selles(self.model_manager.selles_props.items())
+
+    def update_selle(self, filename: str, **changes):
+        """Apply several property changes to a dental saddle with a single save.
+
+        Args:
+            filename: Name of the dental saddle image file
+            **changes: New values keyed by SelleProperties field name
+        """
+        props = self.model_manager.selles_props.get(filename)
+        if props is None:
+            return
+        for name, value in changes.items():
+            setattr(props, name, value)
+        self.save_selle_properties(filename, props)
 
     def update_selle_position(self, filename: str, x: float, y: float):
         """Update position of a dental saddle."""
-        if filename in self.model_manager.selles_props:
-            self.model_manager.selles_props[filename].x = x
-            self.model_manager.selles_props[filename].y = y
-            self.save_selle_properties(filename, self.model_manager.selles_props[filename])
+        self.update_selle(filename, x=x, y=y)
 
     def update_selle_angle(self, filename: str, angle: float):
         """Update rotation angle of a dental saddle."""
-        if filename in self.model_manager.selles_props:
-            self.model_manager.selles_props[filename].angle = angle
-            self.save_selle_properties(filename, self.model_manager.selles_props[filename])
+        self.update_selle(filename, angle=angle)
 
     def update_selle_scale(self, filename: str, scale: float):
         """Update scale of a dental saddle."""
-        if filename in self.model_manager.selles_props:
-            self.model_manager.selles_props[filename].scale = scale
-            self.save_selle_properties(filename, self.model_manager.selles_props[filename])
+        self.update_selle(filename, scale=scale)
 
     def flip_selle_x(self, filename: str):
         """Flip a dental saddle horizontally."""
-        if filename in self.model_manager.selles_props:
-            self.model_manager.selles_props[filename].flip_x = not self.model_manager.selles_props[filename].flip_x
-            self.save_selle_properties(filename, self.model_manager.selles_props[filename])
+        props = self.model_manager.selles_props.get(filename)
+        if props is not None:
+            self.update_selle(filename, flip_x=not props.flip_x)
 
     def flip_selle_y(self, filename: str):
         """Flip a dental saddle vertically."""
-        if filename in self.model_manager.selles_props:
-            self.model_manager.selles_props[filename].flip_y = not self.model_manager.selles_props[filename].flip_y
-            self.save_selle_properties(filename, self.model_manager.selles_props[filename])
+        props = self.model_manager.selles_props.get(filename)
+        if props is not None:
+            self.update_selle(filename, flip_y=not props.flip_y)
 
     def get_selles_props(self) -> Dict[str, SelleProperties]:
         """Get properties of all dental saddles."""
         return self.model_manager.selles_props
 
+    def snapshot_selles(self) -> SelleSnapshot:
+        """Capture the current selle properties into a compact undo frame."""
+        return SelleSnapshot.capture(self.model_manager.selles_props)
+
+    def restore_selles(self, snapshot: SelleSnapshot):
+        """Replace the current selle properties with those of an undo frame.
+
+        The rebuilt dict is adopted as is rather than copied into the old one,
+        which is left untouched for callers that still hold it.
+        """
+        self.model_manager.selles_props = snapshot.to_props()
+
     def save_state(self):
         """Save current state for undo functionality."""
-        self.undo_stack.append({k: v.to_dict() for k, v in self.model_manager.selles_props.items()})
+        snapshot = self.snapshot_selles()
+        if self.undo_stack and self.undo_stack[-1] == snapshot:
+            return  # nothing changed since the last frame
+        self.undo_stack.append(snapshot)
         self.redo_stack.clear()
 
         # Limit stack size
@@ -332,11 +608,8 @@ class DentalDesignModel:
         if not self.undo_stack:
             return False
 
-        self.redo_stack.append({k: v.to_dict() for k, v in self.model_manager.selles_props.items()})
-        state = self.undo_stack.pop()
-        self.model_manager.selles_props.clear()
-        for filename, props_dict in state.items():
-            self.model_manager.selles_props[filename] = SelleProperties.from_dict(props_dict)
+        self.redo_stack.append(self.snapshot_selles())
+        self.restore_selles(self.undo_stack.pop())
         return True
 
     def redo(self) -> bool:
@@ -344,11 +617,8 @@ class DentalDesignModel:
         if not self.redo_stack:
             return False
 
-        self.undo_stack.append({k: v.to_dict() for k, v in self.model_manager.selles_props.items()})
-        state = self.redo_stack.pop()
-        self.model_manager.selles_props.clear()
-        for filename, props_dict in state.items():
-            self.model_manager.selles_props[filename] = SelleProperties.from_dict(props_dict)
+        self.undo_stack.append(self.snapshot_selles())
+        self.restore_selles(self.redo_stack.pop())
         return True
 
     def clear_history(self):
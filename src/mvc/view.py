@@ -5,13 +5,84 @@ View Component for MVC Architecture
 This module contains the UI components and views for the dental design application.
 """
 
+import os
 import tkinter as tk
 from tkinter import simpledialog, messagebox, filedialog
-from PIL import Image, ImageTk, ImageOps
-from typing import Dict, Tuple, Set, Optional, List, Callable
-from ..ui_components import UIComponent, CanvasManager
-from ..config import get_config
-from ..error_handler import handle_error, ImageProcessingError
+from PIL import Image, ImageTk
+from typing import Any, Dict, Tuple, Set, Optional, List, Callable
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from ui_components import UIComponent, CanvasManager
+from config import get_config
+from error_handler import handle_error, ImageProcessingError
+
+# Decoded RGBA selle images keyed by path, so slider changes never hit the disk
+_source_cache: Dict[str, Image.Image] = {}
+
+def _load_source(path: str) -> Image.Image:
+    """Get the decoded RGBA source of a selle image."""
+    img = _source_cache.get(path)
+    if img is None:
+        with Image.open(path) as src:
+            img = _source_cache[path] = src.convert("RGBA")
+    return img
+
+@lru_cache(maxsize=128)
+def _compute_transform(path: str, angle: float, scale: float, flip_x: bool, flip_y: bool,
+                       resample: int) -> Image.Image:
+    """Flip, resize and rotate a selle image. The result is shared and must not be modified."""
+    img = _load_source(path)
+    if flip_x:
+        img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    if flip_y:
+        img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+
+    w, h = img.size
+    img = img.resize((int(w * scale), int(h * scale)), resample)
+    return img.rotate(angle, expand=True, resample=Image.BICUBIC)
+
+def save_options(config, output_path: str) -> Dict[str, Any]:
+    """Encoder options for an export, trading file size for encode speed by default.
+
+    Args:
+        config: Application configuration
+        output_path: Destination path, whose extension selects the encoder
+
+    Returns:
+        Keyword arguments for ``Image.save``
+    """
+    ext = os.path.splitext(output_path)[1].lower()
+    if ext == '.png':
+        return {'compress_level': getattr(config, 'png_compress_level', 1), 'optimize': False}
+    if ext in ('.jpg', '.jpeg'):
+        return {'quality': config.export_quality, 'optimize': False, 'progressive': False}
+    return {'quality': config.export_quality}
+
+# Wisdom teeth have no button
+_EXCLUDED_TEETH = frozenset({'18', '28', '38', '48'})
+
+# Decoded RGBA tooth images keyed by filename; the tooth set is small and static
+_teeth_rgba: Dict[str, Image.Image] = {}
+
+@lru_cache(maxsize=256)
+def _transform_tooth(filename: str, size: int, rotation: float, resample: int) -> Image.Image:
+    """Resize and rotate a tooth decoded in ``_teeth_rgba``.
+
+    The result is shared between displays and exports and must not be modified.
+    """
+    img = _teeth_rgba[filename].resize((size, size), resample)
+    if rotation % 360:
+        img = img.rotate(rotation, expand=True, resample=Image.BICUBIC)
+    return img
+
+def _invalidate_selle_images(path: Optional[str] = None):
+    """Drop cached selle images, for ``path`` only or all of them."""
+    if path is None:
+        _source_cache.clear()
+    else:
+        _source_cache.pop(path, None)
+    _compute_transform.cache_clear()
 
 class DentalDesignView:
     """Main view class for the dental design application."""
@@ -41,13 +112,34 @@ class DentalDesignView:
         self.selle_canvas_ids: Dict[str, int] = {}
         self.teeth_images: Dict[str, ImageTk.PhotoImage] = {}
         self.teeth_objects: Dict[str, int] = {}
+        # Canvas position of each displayed tooth, kept alongside teeth_objects
+        self.teeth_coords: Dict[str, Tuple[float, float]] = {}
         self.selected_teeth: Set[str] = set()
 
+        # PhotoImage cache keyed by (path, mtime, size, scale, rotation, flip_x, flip_y)
+        self.photo_cache: "OrderedDict[tuple, ImageTk.PhotoImage]" = OrderedDict()
+        self.photo_cache_size = 128
+
         # UI state
         self.teeth_frame = None
+        self.teeth_buttons: Dict[str, tk.Button] = {}
         self.active_selle: Optional[str] = None
         self.drag_offset: Optional[Tuple[float, float]] = None
 
+        # Slider events are coalesced into one callback per idle cycle
+        self._transform_pending = False
+        self._move_pending = False
+
+        # Last quantized value of each slider, to drop events that change nothing
+        self._last_quant: Dict[str, int] = {}
+
+        # True while a transform slider is held: previews use a cheap filter
+        self._interactive = False
+
+        # Selle paths that were found on disk, keyed by (model name, filename)
+        self._selle_folders: Dict[str, str] = {}
+        self._resolved_paths: Dict[Tuple[str, str], str] = {}
+
         # Callbacks
         self.callbacks = {}
 
@@ -70,6 +162,54 @@ class DentalDesignView:
         # Create canvas manager
         self.canvas_manager = CanvasManager(self.canvas_frame)
         self.canvas_manager.bind_resize(self._on_canvas_resize)
+        self.bind_selle_events(
+            lambda e, fname: self.select_selle(fname),
+            self.drag_selle,
+            lambda e, fname: self.stop_drag()
+        )
+
+    def bind_selle_events(self, on_press: Callable, on_motion: Callable, on_release: Callable):
+        """Route mouse events on any selle item to the given handlers.
+
+        The bindings are made once on the "selle" tag instead of on every
+        canvas item, and replace any previous ones. Each handler receives
+        the event and the filename of the selle under the pointer.
+
+        Args:
+            on_press: Called on <Button-1>
+            on_motion: Called on <B1-Motion>
+            on_release: Called on <ButtonRelease-1>
+        """
+        for sequence, handler in (("<Button-1>", on_press), ("<B1-Motion>", on_motion),
+                                  ("<ButtonRelease-1>", on_release)):
+            self.canvas_manager.tag_bind("selle", sequence, self._selle_handler(handler))
+
+    def _selle_handler(self, handler: Callable) -> Callable:
+        """Wrap a selle event handler so that it also gets the selle's filename."""
+        def on_event(event):
+            filename = self._selle_under_pointer()
+            if filename is not None:
+                handler(event, filename)
+        return on_event
+
+    def _selle_under_pointer(self) -> Optional[str]:
+        """Get the filename of the selle item under the pointer, from its tags.
+
+        Tk keeps the same "current" item while a button is held, so this also
+        holds during a drag.
+        """
+        for tag in self.canvas_manager.gettags("current"):
+            if tag not in ("selle", "current"):
+                return tag
+        return None
+
+    def _tooth_source(self, filename: str) -> Image.Image:
+        """Get the decoded RGBA image of a tooth, decoded on first use. The result is shared and must not be modified."""
+        img = _teeth_rgba.get(filename)
+        if img is None:
+            with Image.open(os.path.join(self.config.get_teeth_folder(), filename)) as src:
+                img = _teeth_rgba[filename] = src.convert("RGBA")
+        return img
 
     def register_callback(self, event_name: str, callback: Callable):
         """Register a callback for a specific event.
@@ -90,12 +230,98 @@ class DentalDesignView:
             *args: Arguments to pass to the callback
             **kwargs: Keyword arguments to pass to the callback
         """
-        if event_name in self.callbacks:
-            for callback in self.callbacks[event_name]:
-                try:
-                    callback(*args, **kwargs)
-                except Exception as e:
-                    handle_error(e, f"Error in callback for {event_name}")
+        callbacks = self.callbacks.get(event_name)
+        if not callbacks:
+            return
+
+        # A failing callback is reported without stopping the remaining ones
+        for callback in callbacks:
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                handle_error(e, f"Error in callback for {event_name}")
+
+    def get_cached_photo(self, key: tuple) -> Optional[ImageTk.PhotoImage]:
+        """Get a cached PhotoImage and mark it as recently used.
+
+        Args:
+            key: Cache key of the transformed image
+        """
+        photo = self.photo_cache.get(key)
+        if photo is not None:
+            self.photo_cache.move_to_end(key)
+        return photo
+
+    def cache_photo(self, key: tuple, photo: ImageTk.PhotoImage):
+        """Store a PhotoImage, evicting the least recently used one when full.
+
+        Args:
+            key: Cache key of the transformed image
+            photo: PhotoImage to cache
+        """
+        self.photo_cache[key] = photo
+        self.photo_cache.move_to_end(key)
+        if len(self.photo_cache) > self.photo_cache_size:
+            _, evicted = self.photo_cache.popitem(last=False)
+            self.release_photo(evicted)
+
+    def set_photo(self, images: Dict[str, ImageTk.PhotoImage], filename: str, photo: ImageTk.PhotoImage):
+        """Store the PhotoImage shown for ``filename``, releasing the one it replaces.
+
+        Args:
+            images: Either ``teeth_images`` or ``selle_tk_images``
+            filename: Name of the image file
+            photo: New PhotoImage
+        """
+        old = images.get(filename)
+        images[filename] = photo
+        if old is not photo:
+            self.release_photo(old)
+
+    def _update_photo(self, images: Dict[str, ImageTk.PhotoImage], filename: str,
+                      img: Image.Image) -> ImageTk.PhotoImage:
+        """Show ``img`` for ``filename``, pasting into its current PhotoImage when possible.
+
+        A new PhotoImage is only created on first display, when the size
+        changes, or when the current one is shared through ``photo_cache``.
+
+        Args:
+            images: Either ``teeth_images`` or ``selle_tk_images``
+            filename: Name of the image file
+            img: Image to display
+        """
+        photo = images.get(filename)
+        if (photo is not None and (photo.width(), photo.height()) == img.size
+                and not any(p is photo for p in self.photo_cache.values())):
+            photo.paste(img)
+            return photo
+        self.set_photo(images, filename, ImageTk.PhotoImage(img))
+        return images[filename]
+
+    def release_photo(self, photo: Optional[ImageTk.PhotoImage]):
+        """Delete the Tk image behind ``photo`` unless it is still cached or displayed.
+
+        Tk keeps image data until the image is explicitly deleted, which
+        otherwise only happens when Python happens to collect the wrapper.
+
+        Args:
+            photo: PhotoImage that is no longer needed
+        """
+        if photo is None:
+            return
+        in_use = chain(self.photo_cache.values(), self.teeth_images.values(), self.selle_tk_images.values())
+        if any(p is photo for p in in_use):
+            return
+        try:
+            self.canvas_manager.canvas.tk.call("image", "delete", str(photo))
+        except tk.TclError:
+            pass  # already deleted, e.g. released twice
+
+    def _release_images(self, images: Dict[str, ImageTk.PhotoImage]):
+        """Empty ``teeth_images`` or ``selle_tk_images``, releasing each PhotoImage."""
+        while images:
+            _, photo = images.popitem()
+            self.release_photo(photo)
 
     def _on_canvas_resize(self, event):
         """Handle canvas resize events."""
@@ -114,6 +340,7 @@ class DentalDesignView:
         Args:
             model_type: Type of dental arch model
         """
+        _invalidate_selle_images()
         self.trigger_callback("model_changed", model_type)
 
     def create_model_selector(self, models: List[str]):
@@ -140,6 +367,19 @@ class DentalDesignView:
         Args:
             teeth_positions: Dictionary of tooth positions and visibility
         """
+        shown = []
+        for filename in sorted(teeth_positions, key=lambda x: x.rsplit('_', 1)[1]):
+            if filename.rsplit('.', 1)[0].rsplit('_', 1)[1] not in _EXCLUDED_TEETH:
+                shown.append(filename)
+
+        if self.teeth_frame and set(shown) == self.teeth_buttons.keys():
+            # Same teeth as before: only recolor the buttons whose state changed
+            for filename, btn in self.teeth_buttons.items():
+                new_bg = "green" if teeth_positions[filename][4] else "red"
+                if btn.cget("bg") != new_bg:
+                    btn.configure(bg=new_bg)
+            return
+
         if self.teeth_frame:
             self.teeth_frame.destroy()
 
@@ -149,19 +389,20 @@ class DentalDesignView:
         buttons_frame = tk.Frame(self.teeth_frame)
         buttons_frame.pack()
 
-        for filename in sorted(teeth_positions.keys(), key=lambda x: x.split('_')[1]):
-            num = filename.split('.')[0].split('_')[1]
-            if num not in ['18', '28', '38', '48']:
-                present = teeth_positions[filename][4]
-                btn = tk.Button(
-                    buttons_frame, 
-                    text=num, 
-                    width=4, 
-                    bg="green" if present else "red", 
-                    fg="white",
-                    command=lambda f=filename: self.toggle_tooth(f)
-                )
-                btn.pack(side=tk.LEFT, padx=2)
+        self.teeth_buttons.clear()
+        for filename in shown:
+            num = filename.rsplit('.', 1)[0].rsplit('_', 1)[1]
+            present = teeth_positions[filename][4]
+            btn = tk.Button(
+                buttons_frame, 
+                text=num, 
+                width=4, 
+                bg="green" if present else "red", 
+                fg="white",
+                command=lambda f=filename: self.toggle_tooth(f)
+            )
+            btn.pack(side=tk.LEFT, padx=2)
+            self.teeth_buttons[filename] = btn
 
         global_frame = tk.Frame(self.teeth_frame)
         global_frame.pack(pady=5)
@@ -190,6 +431,17 @@ class DentalDesignView:
             command=self.export_canvas
         ).pack(side=tk.LEFT, padx=2)
 
+    def update_tooth_button_state(self, filename: str, present: bool):
+        """Update the color of a single tooth button.
+
+        Args:
+            filename: Name of the tooth image file
+            present: Whether the tooth is present
+        """
+        btn = self.teeth_buttons.get(filename)
+        if btn is not None:
+            btn.configure(bg="green" if present else "red")
+
     def toggle_tooth(self, filename: str):
         """Toggle the visibility of a tooth.
 
@@ -208,11 +460,7 @@ class DentalDesignView:
 
     def show_teeth_positions(self):
         """Show the positions of all teeth."""
-        positions = []
-        for filename, obj_id in self.teeth_objects.items():
-            coords = self.canvas_manager.coords(obj_id)
-            if coords:
-                positions.append(f"{filename}: ({coords[0]:.1f}, {coords[1]:.1f})")
+        positions = [f"{filename}: ({x:.1f}, {y:.1f})" for filename, (x, y) in self.teeth_coords.items()]
 
         if positions:
             messagebox.showinfo("Positions des Dents", "\n".join(positions))
@@ -363,7 +611,7 @@ class DentalDesignView:
             to=800, 
             orient=tk.HORIZONTAL, 
             variable=self.selle_x_var,
-            command=lambda _: self.move_selle()
+            command=lambda v: self._if_changed("x", v, 1) and self._schedule_move()
         )
         tk.Label(selle_frame, text="Décalage X (Selle) :").pack(side=tk.LEFT, padx=5)
         self.selle_x_slider.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
@@ -375,7 +623,7 @@ class DentalDesignView:
             to=600, 
             orient=tk.HORIZONTAL, 
             variable=self.selle_y_var,
-            command=lambda _: self.move_selle()
+            command=lambda v: self._if_changed("y", v, 1) and self._schedule_move()
         )
         tk.Label(selle_frame, text="Décalage Y (Selle) :").pack(side=tk.LEFT, padx=5)
         self.selle_y_slider.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
@@ -385,7 +633,7 @@ class DentalDesignView:
             from_=-180, 
             to=180, 
             orient=tk.HORIZONTAL,
-            command=lambda _: self.apply_transform()
+            command=lambda v: self._if_changed("rotation", v, 1) and self._schedule_transform()
         )
         tk.Label(selle_frame, text="Rotation (°) :").pack(side=tk.LEFT, padx=5)
         self.rotation_slider.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
@@ -396,12 +644,16 @@ class DentalDesignView:
             to=2.0, 
             resolution=0.01, 
             orient=tk.HORIZONTAL,
-            command=lambda _: self.apply_transform()
+            command=lambda v: self._if_changed("scale", v, 0.01) and self._schedule_transform()
         )
         self.scale_slider.set(1.0)
         tk.Label(selle_frame, text="Échelle :").pack(side=tk.LEFT, padx=5)
         self.scale_slider.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
 
+        for slider in (self.rotation_slider, self.scale_slider):
+            slider.bind("<ButtonPress>", self._begin_interaction)
+            slider.bind("<ButtonRelease>", self._end_interaction)
+
     def _setup_flip_buttons(self, parent):
         """Set up buttons for flipping dental saddles.
 
@@ -444,6 +696,59 @@ class DentalDesignView:
             command=self.redo
         ).pack(side=tk.RIGHT, expand=True, fill=tk.X, padx=5)
 
+    def _if_changed(self, name: str, value: str, step: float) -> bool:
+        """Check whether a slider moved by at least one ``step`` since its last event.
+
+        Args:
+            name: Name of the slider
+            value: Value passed by the slider command
+            step: Quantization step, matching the slider resolution so that
+                every step the user makes is applied; bursts of events are
+                coalesced by the idle scheduling instead
+        """
+        quant = round(float(value) / step)
+        if self._last_quant.get(name) == quant:
+            return False
+        self._last_quant[name] = quant
+        return True
+
+    def _schedule_transform(self):
+        """Apply the transformation once Tk is idle, however many slider events arrive before."""
+        if not self._transform_pending:
+            self._transform_pending = True
+            self.root.after_idle(self._flush_transform)
+
+    def _flush_transform(self):
+        """Apply the pending slider transformation."""
+        self._transform_pending = False
+        self.apply_transform()
+
+    def _begin_interaction(self, event=None):
+        """Switch previews to the fast filter while a slider is held."""
+        self._interactive = True
+
+    def _end_interaction(self, event=None):
+        """Re-render the selle with the configured filter once the slider is released."""
+        self._interactive = False
+        self.root.after(100, self._flush_transform)
+
+    def _resample_filter(self) -> int:
+        """Get the resampling filter for the current interaction state."""
+        if self._interactive:
+            return Image.Resampling.BILINEAR
+        return getattr(Image.Resampling, self.config.image_resampling_method)
+
+    def _schedule_move(self):
+        """Move the selle once Tk is idle, however many slider events arrive before."""
+        if not self._move_pending:
+            self._move_pending = True
+            self.root.after_idle(self._flush_move)
+
+    def _flush_move(self):
+        """Apply the pending slider move."""
+        self._move_pending = False
+        self.move_selle()
+
     def apply_transform(self):
         """Apply transformation to the active dental saddle."""
         self.trigger_callback("transform_applied")
@@ -487,18 +792,32 @@ class DentalDesignView:
             rotation: Rotation angle in degrees
         """
         try:
-            img = Image.open(os.path.join(self.config.get_teeth_folder(), filename)).convert("RGBA")
-            img = img.resize((int(self.config.default_dent_size * scale), int(self.config.default_dent_size * scale)), Image.Resampling.LANCZOS)
-            img = img.rotate(rotation, expand=True, resample=Image.BICUBIC)
+            # One Tk image per tooth appearance, shared through photo_cache
+            size, rotation = int(self.config.default_dent_size * scale), round(rotation, 1)
+            key = ("tooth", filename, size, rotation)
+            photo = self.get_cached_photo(key)
+            if photo is None:
+                self._tooth_source(filename)
+                photo = ImageTk.PhotoImage(_transform_tooth(filename, size, rotation, Image.Resampling.LANCZOS))
+                self.cache_photo(key, photo)
+            self.set_photo(self.teeth_images, filename, photo)
+
+            if filename in self.teeth_objects:
+                # Reuse the existing canvas item
+                img_id = self.teeth_objects[filename]
+                self.canvas_manager.itemconfig(img_id, image=photo)
+                self.canvas_manager.set_coords(img_id, x, y)
+                self.teeth_coords[filename] = (x, y)
+                return
 
-            self.teeth_images[filename] = ImageTk.PhotoImage(img)
             img_id = self.canvas_manager.create_image(
                 x, y, 
-                image=self.teeth_images[filename], 
+                image=photo, 
                 tags=("tooth", filename), 
                 anchor=tk.CENTER
             )
             self.teeth_objects[filename] = img_id
+            self.teeth_coords[filename] = (x, y)
 
             # Bind events
             self.canvas_manager.tag_bind(img_id, "<Button-1>", lambda e, fname=filename: self.select_tooth(fname))
@@ -514,6 +833,8 @@ class DentalDesignView:
         if filename in self.teeth_objects:
             self.canvas_manager.delete(self.teeth_objects[filename])
             del self.teeth_objects[filename]
+            self.teeth_coords.pop(filename, None)
+            self.release_photo(self.teeth_images.pop(filename, None))
             self.selected_teeth.discard(filename)
 
     def select_tooth(self, filename: str):
@@ -538,23 +859,52 @@ class DentalDesignView:
         """
         try:
             img = self._load_transformed_selle_image(filename, angle, scale, flip_x, flip_y)
-            if img:
-                self.selle_tk_images[filename] = ImageTk.PhotoImage(img)
-                img_id = self.canvas_manager.create_image(
-                    x, y, 
-                    image=self.selle_tk_images[filename], 
-                    tags=("selle", filename), 
-                    anchor=tk.CENTER
-                )
-                self.selle_canvas_ids[filename] = img_id
+            if img is None:
+                return
+
+            photo = self._update_photo(self.selle_tk_images, filename, img)
+            if filename in self.selle_canvas_ids:
+                # Reuse the existing canvas item
+                img_id = self.selle_canvas_ids[filename]
+                self.canvas_manager.itemconfig(img_id, image=photo)
+                self.canvas_manager.set_coords(img_id, x, y)
+                return
 
-                # Bind events
-                self.canvas_manager.tag_bind(img_id, "<Button-1>", lambda e, fname=filename: self.select_selle(fname))
-                self.canvas_manager.tag_bind(img_id, "<B1-Motion>", lambda e, fname=filename: self.drag_selle(e, fname))
-                self.canvas_manager.tag_bind(img_id, "<ButtonRelease-1>", lambda e: self.stop_drag())
+            img_id = self.canvas_manager.create_image(
+                x, y, 
+                image=photo, 
+                tags=("selle", filename), 
+                anchor=tk.CENTER
+            )
+            self.selle_canvas_ids[filename] = img_id
         except Exception as e:
             handle_error(e, f"Erreur lors de l'affichage de la selle {filename}", show_traceback=True)
 
+    def _transform_args(self, filename: str, angle: float, scale: float, flip_x: bool,
+                        flip_y: bool) -> Optional[tuple]:
+        """Get the ``_compute_transform`` arguments for a selle, or None if its file is missing."""
+        model_name = self.model_manager.get_current_model().name
+        key = (model_name, filename)
+        path = self._resolved_paths.get(key)
+        if path is None:
+            folder = self._selle_folders.get(model_name)
+            if folder is None:
+                folder = self._selle_folders[model_name] = self.config.get_selles_folder(model_name)
+            path = os.path.join(folder, filename)
+
+            if not os.path.exists(path):
+                print(f"Fichier non trouvé: {path}")
+                return None
+            self._resolved_paths[key] = path
+
+        # Scale rounded to the slider resolution, the precision the model stores, so the
+        # preview is rendered at the scale the export uses
+        return (path, round(angle * 2) / 2, round(scale, 2), flip_x, flip_y, self._resample_filter())
+
+    def _forget_selle_path(self, filename: str):
+        """Drop the resolved path of a selle so that the next display checks the disk again."""
+        self._resolved_paths.pop((self.model_manager.get_current_model().name, filename), None)
+
     def _load_transformed_selle_image(self, filename: str, angle: float, scale: float, flip_x: bool, flip_y: bool) -> Optional[Image.Image]:
         """Load and transform a dental saddle image.
 
@@ -569,29 +919,14 @@ class DentalDesignView:
             Transformed image or None if an error occurred
         """
         try:
-            model = self.model_manager.get_current_model()
-            selle_folder = self.config.get_selles_folder(model.name)
-            path = os.path.join(selle_folder, filename)
-
-            if not os.path.exists(path):
-                print(f"Fichier non trouvé: {path}")
-                return None
-
-            with Image.open(path) as img:
-                img = img.copy().convert("RGBA")
-
-                if flip_x:
-                    img = ImageOps.mirror(img)
-                if flip_y:
-                    img = ImageOps.flip(img)
-
-                w, h = img.size
-                img = img.resize((int(w * scale), int(h * scale)), getattr(Image.Resampling, self.config.image_resampling_method))
-                img = img.rotate(angle, expand=True, resample=Image.BICUBIC)
-
-                return img
+            args = self._transform_args(filename, angle, scale, flip_x, flip_y)
+            return _compute_transform(*args) if args else None
+        except OSError as e:
+            self._forget_selle_path(filename)
+            handle_error(e, f"Erreur lors du chargement de {filename}", show_traceback=True)
+            return None
         except Exception as e:
-            handle_error(e, f"Erreur lors du chargement de {path}", show_traceback=True)
+            handle_error(e, f"Erreur lors du chargement de {filename}", show_traceback=True)
             return None
 
     def select_selle(self, filename: str):
@@ -602,10 +937,7 @@ class DentalDesignView:
         """
         self.active_selle = filename
 
-        # Raise selected selle to top
-        for fname in self.selle_canvas_ids:
-            if fname != filename:
-                self.canvas_manager.tag_lower(self.selle_canvas_ids[fname])
+        # Raise selected selle to top; the others keep their relative order
         self.canvas_manager.tag_raise(self.selle_canvas_ids[filename])
 
         # Update sliders with selected selle properties
@@ -671,25 +1003,30 @@ class DentalDesignView:
         try:
             bg_path = os.path.join(self.config.get_backgrounds_folder(), background_file)
             with Image.open(bg_path) as img:
-                img_copy = img.copy()
-                self._resize_background(img_copy)
-                resized_img = img_copy.resize(
+                # resize() already returns a new image, so the file's buffer needs no copy
+                self._resize_background(img)
+                # JPEG backgrounds are decoded at a reduced scale, keeping 2x the target
+                # size for the final filter (no-op for PNG). Export reopens the file at full size.
+                img.draft("RGB", (self.canvas_manager.bg_width * 2, self.canvas_manager.bg_height * 2))
+                resized_img = img.resize(
                     (self.canvas_manager.bg_width, self.canvas_manager.bg_height), 
-                    getattr(Image.Resampling, self.config.image_resampling_method)
+                    self._resample_filter()
                 )
 
                 self.canvas_manager.bg_photo = ImageTk.PhotoImage(resized_img)
+                cx, cy = self.canvas_manager.width // 2, self.canvas_manager.height // 2
 
                 if self.canvas_manager.bg_id:
-                    self.canvas_manager.delete(self.canvas_manager.bg_id)
-
-                self.canvas_manager.bg_id = self.canvas_manager.create_image(
-                    self.canvas_manager.width // 2,
-                    self.canvas_manager.height // 2,
-                    image=self.canvas_manager.bg_photo,
-                    tags=("background",),
-                    anchor=tk.CENTER
-                )
+                    # Reuse the existing canvas item
+                    self.canvas_manager.itemconfig(self.canvas_manager.bg_id, image=self.canvas_manager.bg_photo)
+                    self.canvas_manager.set_coords(self.canvas_manager.bg_id, cx, cy)
+                else:
+                    self.canvas_manager.bg_id = self.canvas_manager.create_image(
+                        cx, cy,
+                        image=self.canvas_manager.bg_photo,
+                        tags=("background",),
+                        anchor=tk.CENTER
+                    )
 
                 self.canvas_manager.tag_lower(self.canvas_manager.bg_id)
 
@@ -722,8 +1059,10 @@ class DentalDesignView:
         """Clear all items from the canvas."""
         self.canvas_manager.delete("all")
         self.teeth_objects.clear()
+        self.teeth_coords.clear()
         self.selle_canvas_ids.clear()
-        self.teeth_images.clear()
+        self._release_images(self.teeth_images)
+        self._release_images(self.selle_tk_images)
 
     def remove_selle(self, filename: str):
         """Remove a dental saddle from the canvas.
@@ -731,10 +1070,14 @@ class DentalDesignView:
         Args:
             filename: Name of the dental saddle image file
         """
+        self._forget_selle_path(filename)
         if filename in self.selle_canvas_ids:
+            _invalidate_selle_images(
+                os.path.join(self.config.get_selles_folder(self.model_manager.get_current_model().name), filename)
+            )
             self.canvas_manager.delete(self.selle_canvas_ids[filename])
             del self.selle_canvas_ids[filename]
-            del self.selle_tk_images[filename]
+            self.release_photo(self.selle_tk_images.pop(filename))
             if self.active_selle == filename:
                 self.active_selle = None
 
@@ -786,84 +1129,3 @@ class DentalDesignView:
     def refresh(self):
         """Refresh the application."""
         self.trigger_callback("refresh")
-
-    def export_canvas_to_file(self, output_path: str):
-        """Export the canvas to a file.
-
-        Args:
-            output_path: Path to save the exported image
-        """
-        try:
-            print(f"Exporting canvas to {output_path}")
-
-            # Create a new image with the canvas size
-            img = Image.new("RGBA", (self.canvas_manager.width, self.canvas_manager.height), (255, 255, 255, 255))
-
-            # Get the current model
-            model = self.model_manager.get_current_model()
-
-            # Draw background
-            bg_path = os.path.join(self.config.get_backgrounds_folder(), model.background)
-            with Image.open(bg_path) as bg_img:
-                bg_img = bg_img.convert("RGBA")
-                bg_resized = bg_img.resize((self.canvas_manager.bg_width, self.canvas_manager.bg_height), getattr(Image.Resampling, self.config.image_resampling_method))
-
-                offset_x = (self.canvas_manager.width - self.canvas_manager.bg_width) // 2
-                offset_y = (self.canvas_manager.height - self.canvas_manager.bg_height) // 2
-                img.paste(bg_resized, (offset_x, offset_y), bg_resized)
-
-            # Create a temporary image for compositing teeth and selles
-            temp_img = Image.new("RGBA", img.size, (0, 0, 0, 0))
-
-            # Draw teeth
-            for filename, obj_id in self.teeth_objects.items():
-                coords = self.canvas_manager.coords(obj_id)
-                if not coords:
-                    continue
-
-                x, y = coords
-                tooth_img = Image.open(os.path.join(self.config.get_teeth_folder(), filename)).convert("RGBA")
-
-                # Get tooth properties
-                tooth_props = None  # This would need to be retrieved from the model
-                if tooth_props:
-                    scale, rotation = tooth_props.scale, tooth_props.rotation
-                    tooth_img = tooth_img.resize((int(self.config.default_dent_size * scale), int(self.config.default_dent_size * scale)), getattr(Image.Resampling, self.config.image_resampling_method))
-                    tooth_img = tooth_img.rotate(rotation, expand=True)
-
-                pos_x = int(x - tooth_img.width // 2)
-                pos_y = int(y - tooth_img.height // 2)
-                temp_img.alpha_composite(tooth_img, (pos_x, pos_y))
-
-            # Draw selles
-            for filename in self.selle_canvas_ids:
-                # Get selle properties from the model
-                selle_props = None  # This would need to be retrieved from the model
-                if selle_props:
-                    if filename in self.selle_tk_images:
-                        selle_img = ImageTk.getimage(self.selle_tk_images[filename])
-                    else:
-                        selle_img = self._load_transformed_selle_image(
-                            filename, 
-                            selle_props.angle, 
-                            selle_props.scale, 
-                            selle_props.flip_x, 
-                            selle_props.flip_y
-                        )
-
-                    if selle_img:
-                        pos_x = int(selle_props.x - selle_img.width // 2)
-                        pos_y = int(selle_props.y - selle_img.height // 2)
-                        temp_img.alpha_composite(selle_img, (pos_x, pos_y))
-
-            # Composite the temporary image onto the main image
-            img.alpha_composite(temp_img)
-
-            # Save the image
-            img.save(output_path, quality=self.config.export_quality)
-            print(f"Export completed successfully")
-
-            # Show success message
-            messagebox.showinfo("Succès", f"Design exporté vers {output_path}")
-        except Exception as e:
-            handle_error(e, "Impossible d'exporter le design", show_traceback=True)
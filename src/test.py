@@ -10,6 +10,7 @@ with open(JSON_PATH, "r", encoding="utf-8") as f:
     teeth_data = json.load(f)
 
 conn = sqlite3.connect(DB_PATH)
+conn.execute("PRAGMA synchronous=NORMAL")
 c = conn.cursor()
 
 def get_nom_from_fichier(fichier):
@@ -18,20 +19,19 @@ def get_nom_from_fichier(fichier):
 c.execute("SELECT fichier FROM dents")
 fichiers_existants = {row[0] for row in c.fetchall()}
 
-ajoutees = 0
-for fichier, coords in teeth_data.items():
-    if fichier not in fichiers_existants:
-        nom = get_nom_from_fichier(fichier)
-        x, y = coords
-        scale = 1.0
-        rotation = 0.0
-        c.execute(
-            "INSERT INTO dents (nom, fichier, x, y, scale, rotation) VALUES (?, ?, ?, ?, ?, ?)",
-            (nom, fichier, x, y, scale, rotation)
-        )
-        ajoutees += 1
-
-conn.commit()
+# Toutes les nouvelles dents en un seul executemany, dans une seule transaction
+rows = [
+    (get_nom_from_fichier(fichier), fichier, x, y, 1.0, 0.0)
+    for fichier, (x, y) in teeth_data.items()
+    if fichier not in fichiers_existants
+]
+with conn:
+    c.executemany(
+        "INSERT INTO dents (nom, fichier, x, y, scale, rotation) VALUES (?, ?, ?, ?, ?, ?)",
+        rows
+    )
+ajoutees = len(rows)
+
 conn.close()
 
 print(f"Importation terminée ! {ajoutees} dents ajoutées.")
@@ -6,16 +6,24 @@ This module contains reusable UI components used throughout the application.
 """
 
 import tkinter as tk
-from tkinter import simpledialog, messagebox, filedialog
+from tkinter import ttk, simpledialog, messagebox, filedialog
 from PIL import Image, ImageTk, ImageOps
 from typing import Dict, Tuple, Set, Optional, List
 from functools import lru_cache
 from threading import Timer
+from collections import deque
 
 class UIComponent:
     """A reusable UI component wrapper that creates a labeled frame."""
+    STYLE = "PPA.TLabelframe"
+    _style_ready = False
+
     def __init__(self, parent, text, command=None):
-        self.frame = tk.LabelFrame(parent, text=text, padx=5, pady=5)
+        if not UIComponent._style_ready:
+            # Configured once; ttk.Style needs a Tk root, so not at import time
+            ttk.Style(parent).configure(UIComponent.STYLE, padding=5)
+            UIComponent._style_ready = True
+        self.frame = ttk.Labelframe(parent, text=text, style=UIComponent.STYLE)
         self.command = command
 
 class CanvasManager:
@@ -32,6 +40,10 @@ class CanvasManager:
         self.bg_height = 0
         self.original_bg_width = 0
         self.original_bg_height = 0
+        self._pending_ops = deque()
+        self._flush_scheduled = False
+        # Item positions as last set from Python, so coords() skips the Tcl round-trip
+        self._pos_cache = {}
 
     def bind_resize(self, callback):
         """Bind a callback function to canvas resize events."""
@@ -39,19 +51,68 @@ class CanvasManager:
 
     def create_image(self, x, y, image, tags, anchor=tk.CENTER):
         """Create an image on the canvas."""
-        return self.canvas.create_image(x, y, image=image, tags=tags, anchor=anchor)
+        item = self.canvas.create_image(x, y, image=image, tags=tags, anchor=anchor)
+        self._pos_cache[item] = (float(x), float(y))
+        return item
 
     def delete(self, item):
         """Delete an item from the canvas."""
+        if item == "all":
+            self._pending_ops.clear()
+        if item == "all" or item == self.bg_id:
+            self.bg_id = None
+        if isinstance(item, int):
+            self._pos_cache.pop(item, None)
+        else:
+            # A tag may match any item; Tk never reuses ids, so dropping the cache is safe
+            self._pos_cache.clear()
         self.canvas.delete(item)
 
+    def defer(self, op, *args):
+        """Queue a canvas operation to run with the others on the next idle tick."""
+        self._pending_ops.append((op, args))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.canvas.after_idle(self._flush_ops)
+
+    def _flush_ops(self):
+        """Run the queued canvas operations, merging all deletes into one call."""
+        self._flush_scheduled = False
+        to_delete = []
+        seen = set()
+        while self._pending_ops:
+            op, args = self._pending_ops.popleft()
+            if op == "delete":
+                for item in args:
+                    if item not in seen:
+                        seen.add(item)
+                        to_delete.append(item)
+            elif args and args[0] not in seen:
+                getattr(self.canvas, op)(*args)
+        if to_delete:
+            for item in to_delete:
+                self._pos_cache.pop(item, None)
+            self.canvas.delete(*to_delete)
+
     def coords(self, item):
         """Get the coordinates of an item on the canvas."""
+        pos = self._pos_cache.get(item)
+        if pos is not None:
+            return list(pos)
         return self.canvas.coords(item)
 
     def set_coords(self, item, x, y):
         """Set the coordinates of an item on the canvas."""
         self.canvas.coords(item, x, y)
+        self._pos_cache[item] = (float(x), float(y))
+
+    def itemconfig(self, item, **options):
+        """Update the options of an item on the canvas."""
+        self.canvas.itemconfig(item, **options)
+
+    def gettags(self, item):
+        """Get the tags of an item on the canvas."""
+        return self.canvas.gettags(item)
 
     def tag_raise(self, tag):
         """Raise items with a given tag to the top."""
@@ -0,0 +1,12 @@
+"""Shared pytest setup.
+
+The application modules live in src/ and import each other as top-level
+modules (``from mvc.model import ...``), as they do when the app is run.
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -0,0 +1,111 @@
+"""Tests for the MVC controller's image helpers."""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from mvc.controller import _alpha_crop, _blend_over, _canvas_to_image, _format_tooth_ranges, affine_params
+
+ANGLES = [0, 12.3, 30, 45, -20, 90, 135, 180, 270, 333.5]
+
+
+def _noise(width, height):
+    """Opaque RGBA noise, so any misplaced pixel shows up."""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    pixels[..., 3] = 255
+    return Image.fromarray(pixels, "RGBA")
+
+
+def _translucent(width, height, seed):
+    """RGBA noise with every alpha level."""
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (height, width, 4), dtype=np.uint8), "RGBA")
+
+
+def _flip(img, flip_x, flip_y):
+    if flip_x:
+        img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    if flip_y:
+        img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    return img
+
+
+@pytest.mark.parametrize("angle", ANGLES)
+@pytest.mark.parametrize("scale", [0.37, 0.5, 1.0, 1.5])
+@pytest.mark.parametrize("flip_x, flip_y", [(False, False), (True, False), (False, True), (True, True)])
+@pytest.mark.parametrize("width, height", [(60, 40), (73, 41)])
+def test_affine_size_matches_pil_rotate(width, height, flip_x, flip_y, scale, angle):
+    img = _flip(Image.new("RGBA", (width, height)), flip_x, flip_y)
+    expected = img.resize((int(width * scale), int(height * scale))).rotate(angle, expand=True)
+
+    size, _ = affine_params(width, height, angle, scale, flip_x, flip_y)
+    assert size == expected.size
+
+
+@pytest.mark.parametrize("angle", ANGLES)
+def test_affine_rotation_matches_pil_rotate(angle):
+    img = _noise(73, 41)
+    size, matrix = affine_params(img.width, img.height, angle, 1.0, False, False)
+
+    got = img.transform(size, Image.AFFINE, matrix, resample=Image.BICUBIC)
+    assert got.tobytes() == img.rotate(angle, expand=True, resample=Image.BICUBIC).tobytes()
+
+
+@pytest.mark.parametrize("angle", ANGLES)
+@pytest.mark.parametrize("flip_x, flip_y", [(True, False), (False, True), (True, True)])
+def test_affine_flips_match_pil(angle, flip_x, flip_y):
+    img = _noise(73, 41)
+    size, matrix = affine_params(img.width, img.height, angle, 1.0, flip_x, flip_y)
+
+    got = np.asarray(img.transform(size, Image.AFFINE, matrix, resample=Image.BICUBIC), dtype=np.int16)
+    expected = _flip(img, flip_x, flip_y).rotate(angle, expand=True, resample=Image.BICUBIC)
+    # Rounding may move a single edge pixel in or out of the canvas
+    assert np.abs(got - np.asarray(expected, dtype=np.int16)).mean() < 0.1
+
+
+@pytest.mark.parametrize("x, y", [(10, 5), (-7, -3), (50, 30), (200, 5)])
+@pytest.mark.parametrize("opaque_base", [True, False])
+def test_blend_over_matches_alpha_composite(x, y, opaque_base):
+    base = _noise(64, 48) if opaque_base else _translucent(64, 48, 1)
+    layer = _translucent(25, 30, 2)
+
+    canvas = np.asarray(base, dtype=np.float32) / 255.0
+    canvas[..., :3] *= canvas[..., 3:]
+    _blend_over(canvas, layer, x, y)
+
+    expected = base.copy()
+    expected.alpha_composite(layer, (max(x, 0), max(y, 0)), (max(-x, 0), max(-y, 0)))
+    diff = np.abs(np.asarray(_canvas_to_image(canvas), dtype=np.int16) - np.asarray(expected, dtype=np.int16))
+    # PIL rounds in 8-bit integer steps; the float canvas only rounds once at the end
+    if opaque_base:
+        assert diff.max() <= 1
+    else:
+        assert diff[..., 3].max() <= 1
+        assert diff[..., :3].mean() < 0.5
+
+
+def test_alpha_crop_blends_like_the_full_image():
+    layer = Image.new("RGBA", (40, 30))
+    layer.paste(_translucent(12, 9, 3), (20, 7))
+    part, dx, dy = _alpha_crop(layer)
+    assert (part.size, dx, dy) == ((12, 9), 20, 7)
+
+    full = np.asarray(_noise(64, 48), dtype=np.float32) / 255.0
+    cropped = full.copy()
+    _blend_over(full, layer, -5, 3)
+    _blend_over(cropped, part, -5 + dx, 3 + dy)
+    np.testing.assert_array_equal(full, cropped)
+
+    assert _alpha_crop(Image.new("RGBA", (5, 5))) is None
+
+
+@pytest.mark.parametrize("numbers, expected", [
+    ([7], ["7"]),
+    ([5, 3, 4, 7], ["3-5", "7"]),
+    ([11, 12, 21, 22, 23, 31, 33], ["11-12", "21-23", "31", "33"]),
+    ([48, 47, 46, 45], ["45-48"]),
+    ([], []),
+])
+def test_format_tooth_ranges(numbers, expected):
+    assert _format_tooth_ranges(iter(numbers)) == expected
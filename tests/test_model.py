@@ -0,0 +1,153 @@
+"""Tests for the MVC model."""
+
+import json
+import sqlite3
+
+import pytest
+
+from error_handler import DatabaseError
+from mvc.model import DatabaseManager, DentalDesignModel, SelleProperties, SelleSnapshot
+
+PROPS = {'x': 120.0, 'y': 80.5, 'angle': 15.0, 'scale': 1.25, 'flip_x': True, 'flip_y': False}
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "dental_database.db"))
+    manager.initialize_database()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def model(tmp_path):
+    (tmp_path / "elements_valides").mkdir()
+    design = DentalDesignModel(str(tmp_path), str(tmp_path))
+    yield design
+    design.db_manager.close()
+
+
+def _stored_props(db_path, image):
+    """Read the committed properties of a selle through a separate connection."""
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute("SELECT props FROM Selles WHERE image = ?", (image,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def test_saved_selle_is_read_back_before_it_is_committed(db):
+    db.save_selle_properties("selle.png", PROPS)
+    assert db.load_selle_properties("selle.png") == dict(PROPS, image="selle.png")
+
+
+def test_flush_commits_pending_selles(db):
+    db.save_selle_properties("a.png", PROPS)
+    db.save_selle_properties("b.png", dict(PROPS, x=1.0))
+    db.save_selle_properties("a.png", dict(PROPS, x=2.0))
+    db.flush()
+
+    assert not db._pending
+    assert _stored_props(db.db_path, "a.png") == dict(PROPS, x=2.0)
+    assert _stored_props(db.db_path, "b.png") == dict(PROPS, x=1.0)
+
+
+def test_failed_write_is_kept_reported_and_retried(db):
+    with db.conn as conn:
+        conn.execute("DROP TABLE Selles")
+
+    db.save_selle_properties("selle.png", PROPS)
+    with pytest.raises(DatabaseError):
+        db.flush()
+    # Still pending, so reads see the edit
+    assert db.load_selle_properties("selle.png") == dict(PROPS, image="selle.png")
+
+    db.initialize_database()
+    db.flush()
+    assert not db._pending
+    assert _stored_props(db.db_path, "selle.png") == PROPS
+
+
+def test_selle_updates_modify_the_properties_handed_out(model):
+    props = model.get_selle_properties("selle.png")
+    assert model.get_selle_properties("selle.png") is props
+
+    model.update_selle_position("selle.png", 10.0, 20.0)
+    model.update_selle_angle("selle.png", 30.0)
+    assert (props.x, props.y, props.angle) == (10.0, 20.0, 30.0)
+
+    model.flush()
+    assert model.load_selle_properties("selle.png") == props
+
+
+def test_old_selles_table_is_migrated_to_json(tmp_path):
+    db_path = str(tmp_path / "dental_database.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+        CREATE TABLE Selles (
+            image TEXT PRIMARY KEY, x REAL, y REAL, angle REAL, scale REAL,
+            flip_x INTEGER, flip_y INTEGER, type_element TEXT
+        )""")
+        conn.execute("INSERT INTO Selles VALUES ('selle.png', 120.0, 80.5, 15.0, 1.25, 1, 0, 'Selles')")
+    conn.close()
+
+    manager = DatabaseManager(db_path)
+    manager.initialize_database()
+    manager.initialize_database()  # Already migrated: no-op
+    try:
+        with manager.conn as conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(Selles)")]
+        assert columns == ["image", "props"]
+        assert _stored_props(db_path, "selle.png") == dict(PROPS, type_element="Selles")
+        assert manager.load_selle_properties("selle.png") == dict(PROPS, image="selle.png", type_element="Selles")
+    finally:
+        manager.close()
+
+
+def test_migrated_properties_load_into_the_model(model):
+    model.db_manager.save_selle_properties("selle.png", PROPS)
+    model.db_manager.flush()
+    with model.db_manager.conn as conn:
+        conn.execute("UPDATE Selles SET props = ? WHERE image = 'selle.png'",
+                     (json.dumps(dict(PROPS, type_element="Selles")),))
+
+    props = model.load_selle_properties("selle.png")
+    assert (props.x, props.angle, props.flip_x) == (PROPS['x'], PROPS['angle'], True)
+
+
+def test_selle_snapshot_round_trip():
+    selles = {
+        "a.png": SelleProperties("a.png", 1.5, -2.0, 33.3, 0.8, True, False),
+        "b.png": SelleProperties("b.png", 400.0, 300.0, 0.0, 1.0, False, True),
+    }
+    snapshot = SelleSnapshot.capture(selles)
+    restored = snapshot.to_props()
+
+    assert restored == selles
+    assert list(restored) == list(selles)
+    assert isinstance(restored["a.png"].flip_x, bool) and isinstance(restored["a.png"].x, float)
+    assert SelleSnapshot.capture(restored) == snapshot
+    assert SelleSnapshot.capture({}).to_props() == {}
+
+
+def test_restore_selles_brings_back_a_snapshot(model):
+    model.get_selle_properties("selle.png")
+    model.update_selle_position("selle.png", 10.0, 20.0)
+    frames = len(model.undo_stack)
+    model.save_state()  # Unchanged: no new frame
+    assert len(model.undo_stack) == frames
+
+    snapshot = model.snapshot_selles()
+    model.update_selle("selle.png", angle=45.0, flip_x=True)
+    model.restore_selles(snapshot)
+    props = model.get_selles_props()["selle.png"]
+    assert (props.x, props.y, props.angle, props.flip_x) == (10.0, 20.0, 0.0, False)
+
+
+def test_saving_all_selles_keeps_the_undo_history(model):
+    model.get_selle_properties("selle.png")
+    model.update_selle_position("selle.png", 10.0, 20.0)
+    model.update_selle_angle("selle.png", 30.0)
+    assert model.undo()
+    undo, redo = len(model.undo_stack), len(model.redo_stack)
+
+    model.save_all_selle_properties()
+    assert (len(model.undo_stack), len(model.redo_stack)) == (undo, redo)